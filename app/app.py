@@ -3,46 +3,590 @@ Sistema de Admisión ULEAM - Versión con Excel y Flask-Mail
 Implementa roles (Admin/Estudiante) y operaciones CRUD sobre Excel
 """
 
-from flask import Flask, render_template, request, redirect, url_for, flash, session
+import os
+
+# Servidor gevent opcional (SERVIDOR=gevent): el parcheo de sockets e hilos
+# tiene que hacerse antes de importar Flask, requests y threading
+if __name__ == '__main__' and os.environ.get('SERVIDOR') == 'gevent':
+    from gevent import monkey
+    monkey.patch_all()
+
+from flask import Flask, Blueprint, render_template, stream_template, request, redirect, url_for, flash, session, g, make_response
+from flask.globals import request_ctx
+from flask.json.provider import DefaultJSONProvider
 from flask_mail import Mail
+from jinja2 import FileSystemBytecodeCache
+from markupsafe import Markup
+from werkzeug.local import LocalProxy
 import requests
+from requests.adapters import HTTPAdapter
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from threading import Event, Lock
 
 TYPESCRIPT_API = "http://localhost:3000"
+TYPESCRIPT_TIMEOUT = 2  # segundos; un servidor TS caído no debe colgar la vista
+TYPESCRIPT_TIMEOUT_CONEXION = 0.5  # segundos para abrir el socket (el servidor es local)
 
 from database.excel_manager import ExcelManager
 from services.mail_service import MailService as EmailService
 from config import Config
-import os
+import gzip
+import orjson
+import re
+from types import MappingProxyType, SimpleNamespace
+
+# Cédula: exactamente 10 dígitos ASCII (una sola pasada, sin len + isdigit)
+_CEDULA_RE = re.compile(r'[0-9]{10}')
+
+# Catálogos fijos de inscripción (solo lectura, se crean una vez al importar)
+_JORNADAS = MappingProxyType({
+    '1': 'Matutina',
+    '2': 'Vespertina',
+    '3': 'Nocturna'
+})
+
+# Calificación del puntaje final: cortes de porcentaje (>=) y (texto, clase CSS) por tramo
+_CORTES_PUNTAJE = (60, 70, 80, 90)
+_NIVELES_PUNTAJE = (
+    ("INSUFICIENTE", "estado-rechazado"),
+    ("ACEPTABLE", "estado-pendiente"),
+    ("BUENO", "estado-completo"),
+    ("MUY BUENO", "estado-completo"),
+    ("EXCELENTE", "estado-completo"),
+)
+
+_CARRERAS = MappingProxyType({
+    101: 'Tecnologías de Información',
+    102: 'Medicina',
+    103: 'Ingeniería Civil',
+    104: 'Administración',
+    105: 'Derecho'
+})
+
+# Sesión HTTP compartida: reutiliza las conexiones keep-alive hacia el servidor TypeScript
+# (un reintento solo cubre sockets keep-alive que el servidor ya cerró al conectar)
+_ts = requests.Session()
+_ts.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=1))
+_ts.headers['Content-Type'] = 'application/json'
+_TS_TIMEOUTS = (TYPESCRIPT_TIMEOUT_CONEXION, TYPESCRIPT_TIMEOUT)
+
+
+# GET en curso hacia TypeScript: {url: {'listo': Event, 'resultado': dict}}
+_ts_en_vuelo = {}
+_ts_en_vuelo_lock = Lock()
+
+
+def _get_typescript_compartido(url):
+    """
+    Hace un GET al servidor TypeScript compartiendo la respuesta entre
+    peticiones concurrentes a la misma URL: la primera hace la llamada
+    y las demás esperan su resultado en lugar de repetirla
+
+    Args:
+        url: URL completa del endpoint
+
+    Returns:
+        dict: Respuesta JSON (compartida; no modificarla)
+    """
+    with _ts_en_vuelo_lock:
+        llamada = _ts_en_vuelo.get(url)
+        es_primera = llamada is None
+        if es_primera:
+            llamada = {'listo': Event(), 'resultado': None}
+            _ts_en_vuelo[url] = llamada
+
+    if not es_primera:
+        llamada['listo'].wait(TYPESCRIPT_TIMEOUT_CONEXION + TYPESCRIPT_TIMEOUT + 1)
+        if llamada['resultado'] is None:
+            return {'exito': False, 'error': 'Sin respuesta del servidor TypeScript'}
+        return llamada['resultado']
+
+    try:
+        llamada['resultado'] = orjson.loads(_ts.get(url, timeout=_TS_TIMEOUTS).content)
+    except Exception as e:
+        print(f"Error llamando a TypeScript: {e}")
+        llamada['resultado'] = {'exito': False, 'error': str(e)}
+    finally:
+        with _ts_en_vuelo_lock:
+            _ts_en_vuelo.pop(url, None)
+        llamada['listo'].set()
+
+    return llamada['resultado']
 
 
 def llamar_typescript(endpoint, metodo='GET', datos=None):
     """
     Llama al servidor TypeScript
+    Los GET concurrentes al mismo endpoint se agrupan en una sola llamada
     """
     url = f"{TYPESCRIPT_API}{endpoint}"
+
+    if metodo == 'GET':
+        return _get_typescript_compartido(url)
     
     try:
-        if metodo == 'GET':
-            respuesta = requests.get(url)
-        elif metodo == 'POST':
-            respuesta = requests.post(url, json=datos)
-        
-        return respuesta.json()
+        respuesta = _ts.post(url, data=orjson.dumps(datos), timeout=_TS_TIMEOUTS)
+        return orjson.loads(respuesta.content)
     except Exception as e:
         print(f"Error llamando a TypeScript: {e}")
         return {'exito': False, 'error': str(e)}
 
+# Llamadas a TypeScript cuyo resultado no decide la respuesta HTTP
+_ts_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='typescript')
+
+
+def llamar_typescript_async(endpoint, metodo='POST', datos=None):
+    """
+    Envía la llamada al servidor TypeScript en segundo plano y retorna de inmediato
+
+    Los errores se registran en consola al terminar la llamada.
+
+    Args:
+        endpoint: Ruta del API (ej: '/api/postulantes')
+        metodo: Método HTTP
+        datos: Cuerpo JSON
+
+    Returns:
+        Future: Resultado de llamar_typescript cuando termine
+    """
+    def registrar(futuro):
+        resultado = futuro.result()
+        if not resultado.get('exito'):
+            print(f"⚠️ TypeScript {metodo} {endpoint}: {resultado.get('error')}")
+
+    futuro = _ts_pool.submit(llamar_typescript, endpoint, metodo, datos)
+    futuro.add_done_callback(registrar)
+    return futuro
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Proveedor JSON de Flask basado en orjson (serializa y parsea en Rust).
+    Las llamadas con opciones propias del módulo json (p. ej. object_hook,
+    que usa el serializador de la cookie de sesión) se delegan al proveedor
+    por defecto para no perderlas
+    """
+
+    def dumps(self, obj, **kwargs):
+        if kwargs.keys() - {'separators'}:
+            return super().dumps(obj, **kwargs)
+        opciones = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            opciones |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=opciones).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.config.from_object(Config)
+# '/opcion3/' y '/opcion3' llegan a la misma vista sin redirección 308
+app.url_map.strict_slashes = False
+
+# Caché en disco de plantillas compiladas: los procesos nuevos no vuelven a parsearlas
+os.makedirs(app.config['JINJA_CACHE_DIR'], exist_ok=True)
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(app.config['JINJA_CACHE_DIR'], '%s.cache')
+
+# Plantillas de los menús compiladas una sola vez: se muestran tras cada acción del usuario
+_dashboard_tpl = app.jinja_env.get_template('dashboard.html')
+_index_ts_tpl = app.jinja_env.get_template('index_ts.html')
+
+# Tarjeta de un postulante en el listado (opción 4)
+_tarjeta_tpl = app.jinja_env.get_template('_tarjeta_postulante.html')
+
+
+@lru_cache(maxsize=4096)
+def _tarjeta_postulante(cedula, primer_nombre, apellido_paterno, correo, estado):
+    """
+    HTML de la tarjeta de un postulante, memorizado por sus datos visibles
+
+    Las filas que no cambian entre listados no se vuelven a renderizar.
+
+    Returns:
+        Markup: Tarjeta ya escapada, lista para insertar en la plantilla
+    """
+    return Markup(_tarjeta_tpl.render(cedula=cedula,
+                                      primer_nombre=primer_nombre,
+                                      apellido_paterno=apellido_paterno,
+                                      correo=correo,
+                                      estado=estado))
+
+@lru_cache(maxsize=1024)
+def _dashboard_html(cedula, nombre, rol, estado, raiz):
+    """
+    Dashboard ya renderizado y codificado, memorizado por los datos de sesión
+    que muestra y la raíz de la aplicación (las URLs dependen de ella)
+
+    Returns:
+        bytes: HTML en UTF-8
+    """
+    usuario = SimpleNamespace(cedula=cedula, nombre=nombre, rol=rol, estado=estado)
+    return _dashboard_tpl.render(user=usuario).encode('utf-8')
+
+@lru_cache(maxsize=1024)
+def _index_ts_html(nombre, rol, raiz):
+    """
+    Menú de funciones tradicionales ya renderizado; solo varía con el nombre y el rol
+
+    Returns:
+        bytes: HTML en UTF-8
+    """
+    return _index_ts_tpl.render(nombre=nombre, rol=rol).encode('utf-8')
 
 # Inicializar Flask-Mail
 mail = Mail(app)
 
+# Gestor de Excel y servicio de email: se crean en el primer uso, no al importar
+_servicios = {}
+_servicios_lock = Lock()
+
+
+def _obtener_servicio(nombre, fabrica):
+    """
+    Devuelve la instancia única de un servicio, creándola la primera vez
+
+    Args:
+        nombre: Clave del servicio
+        fabrica: Función sin argumentos que construye la instancia
+
+    Returns:
+        object: Instancia compartida del servicio
+    """
+    servicio = _servicios.get(nombre)
+    if servicio is None:
+        with _servicios_lock:
+            servicio = _servicios.get(nombre)
+            if servicio is None:
+                servicio = _servicios[nombre] = fabrica()
+    return servicio
+
+
 # Inicializar gestor de Excel
-db = ExcelManager(app.config['EXCEL_PATH'])
+db = LocalProxy(lambda: _obtener_servicio('db', lambda: ExcelManager(app.config['EXCEL_PATH'])))
 
 # Inicializar servicio de email
-email_service = EmailService(mail)
+email_service = LocalProxy(lambda: _obtener_servicio('email', lambda: EmailService(mail)))
+
+# Envío de correos en segundo plano: la respuesta HTTP no espera al servidor SMTP
+_correo_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='correo')
+
+
+def enviar_correo_async(metodo, *args):
+    """
+    Encola un envío del servicio de correo y retorna de inmediato
+
+    Args:
+        metodo: Nombre del método de MailService (ej: 'enviar_confirmacion_evaluacion')
+        *args: Argumentos para ese método
+
+    Returns:
+        Future: Resultado (exito, mensaje) del envío cuando termine
+    """
+    enviar = getattr(email_service._get_current_object(), metodo)
+
+    def tarea():
+        # Flask-Mail necesita el contexto de la aplicación para leer la configuración
+        with app.app_context():
+            exito, mensaje = enviar(*args)
+        if not exito:
+            print(f"⚠️ {mensaje}")
+        return exito, mensaje
+
+    return _correo_pool.submit(tarea)
+
+# Vistas accesibles sin haber iniciado sesión
+_ENDPOINTS_PUBLICOS = frozenset({'index', 'login', 'logout', 'static', 'test_typescript'})
+
+
+@app.before_request
+def cargar_usuario():
+    """
+    Lee una sola vez los datos de sesión del usuario y los deja en g.user
+
+    Es además el único control de acceso: sin sesión, las vistas privadas
+    redirigen al inicio (o responden 401 a clientes JSON).
+    """
+    if 'cedula' in session:
+        g.user = SimpleNamespace(cedula=session['cedula'],
+                                 nombre=session.get('nombre', ''),
+                                 rol=session.get('rol', 'ESTUDIANTE'),
+                                 estado=session.get('estado', 'PENDIENTE'))
+        return None
+
+    g.user = None
+    # endpoint None: ruta inexistente, se deja llegar al manejador 404
+    if request.endpoint is None or request.endpoint in _ENDPOINTS_PUBLICOS:
+        return None
+    return _responder_error('Debe iniciar sesión', 'index', 401)
+
+# Tipos de contenido que vale la pena comprimir
+_MIMETYPES_COMPRIMIBLES = frozenset({'text/html', 'text/css', 'text/plain',
+                                     'application/json', 'application/javascript'})
+
+# Cuerpos gzip de las páginas con ETag (las memorizadas se repiten): {etag: bytes}
+_gzip_por_etag = {}
+_GZIP_POR_ETAG_MAX = 256
+
+
+@app.after_request
+def comprimir_respuesta(respuesta):
+    """Comprime con gzip las respuestas de texto si el navegador lo acepta"""
+    if (respuesta.direct_passthrough or respuesta.is_streamed
+            or respuesta.status_code < 200 or respuesta.status_code >= 300
+            or 'Content-Encoding' in respuesta.headers
+            or respuesta.mimetype not in _MIMETYPES_COMPRIMIBLES
+            or 'gzip' not in request.accept_encodings):
+        return respuesta
+
+    datos = respuesta.get_data()
+    if len(datos) < app.config['COMPRESS_MIN_SIZE']:
+        return respuesta
+
+    # El ETag es un hash del cuerpo: mismo ETag, mismo gzip
+    etag = respuesta.get_etag()[0]
+    comprimido = _gzip_por_etag.get(etag) if etag else None
+    if comprimido is None:
+        comprimido = gzip.compress(datos, compresslevel=app.config['COMPRESS_LEVEL'])
+        if etag:
+            if len(_gzip_por_etag) >= _GZIP_POR_ETAG_MAX:
+                _gzip_por_etag.clear()
+            _gzip_por_etag[etag] = comprimido
+
+    respuesta.set_data(comprimido)
+    respuesta.headers['Content-Encoding'] = 'gzip'
+    respuesta.vary.add('Accept-Encoding')
+    return respuesta
+
+# Los estáticos se enlazan con ?v=<fecha de modificación>: un cambio en el archivo
+# cambia la URL, así que el navegador puede guardarlos un año sin revalidar
+_CACHE_ESTATICOS_VERSIONADOS = 'public, max-age=31536000, immutable'
+
+@lru_cache(maxsize=None)
+def _version_estatico(filename):
+    """
+    Versión de un archivo estático (se calcula una vez por proceso)
+
+    Args:
+        filename: Ruta relativa a la carpeta static
+
+    Returns:
+        int: Fecha de modificación, o None si el archivo no existe
+    """
+    try:
+        return int(os.path.getmtime(os.path.join(app.static_folder, filename)))
+    except OSError:
+        return None
+
+@app.url_defaults
+def versionar_estaticos(endpoint, valores):
+    """Agrega ?v= a las URLs de url_for('static', ...)"""
+    if endpoint == 'static' and 'filename' in valores and 'v' not in valores:
+        version = _version_estatico(valores['filename'])
+        if version is not None:
+            valores['v'] = version
+
+@app.after_request
+def cachear_estaticos(respuesta):
+    """Marca como inmutables los estáticos pedidos con su versión"""
+    if request.endpoint == 'static' and 'v' in request.args and respuesta.status_code in (200, 304):
+        respuesta.headers['Cache-Control'] = _CACHE_ESTATICOS_VERSIONADOS
+    return respuesta
+
+def requiere_admin(mensaje='Acceso denegado'):
+    """
+    Restringe una vista a administradores (la sesión ya la exige cargar_usuario)
+
+    Args:
+        mensaje: Texto del flash para quien no es administrador
+
+    Returns:
+        function: Decorador de la vista
+    """
+    def decorador(vista):
+        @wraps(vista)
+        def envoltura(*args, **kwargs):
+            usuario = g.user
+            if usuario is None or usuario.rol != 'ADMIN':
+                flash(mensaje, 'error')
+                return redirect(url_fija('dashboard'))
+            return vista(*args, **kwargs)
+        return envoltura
+    return decorador
+
+def _hay_flashes():
+    """
+    Indica si hay mensajes flash pendientes o si la plantilla ya los mostró
+    en esta petición (al leerlos get_flashed_messages los saca de la sesión)
+    """
+    return bool(session.get('_flashes') or request_ctx.flashes)
+
+def _respuesta_condicional(cuerpo):
+    """
+    Envía una página con ETag para que el navegador reciba 304 si no cambió
+
+    Si la página muestra mensajes flash no es repetible y se envía sin ETag.
+
+    Args:
+        cuerpo: HTML ya renderizado (str o bytes)
+
+    Returns:
+        Response: Respuesta 200 con ETag o 304 sin cuerpo
+    """
+    respuesta = make_response(cuerpo)
+    if _hay_flashes():
+        return respuesta
+
+    # ETag débil: el cuerpo puede viajar comprimido con gzip
+    respuesta.add_etag(weak=True)
+    respuesta.cache_control.private = True
+    respuesta.cache_control.no_cache = True
+    return respuesta.make_conditional(request)
+
+@lru_cache(maxsize=1024)
+def _formulario_html(plantilla, raiz, contexto):
+    """HTML codificado de un formulario para un contexto dado (ver _render_formulario)"""
+    return render_template(plantilla, **dict(contexto)).encode('utf-8')
+
+def _render_formulario(plantilla, **contexto):
+    """
+    Renderiza un formulario cuyo contexto son solo textos/booleanos y memoriza
+    el resultado: el mismo formulario para el mismo usuario no vuelve a pasar por Jinja
+
+    Args:
+        plantilla: Nombre de la plantilla
+        **contexto: Variables hashables para la plantilla
+
+    Returns:
+        Response: Respuesta 200 con ETag o 304 sin cuerpo
+    """
+    if _hay_flashes():
+        return _render_condicional(plantilla, **contexto)
+    html = _formulario_html(plantilla, request.script_root, tuple(sorted(contexto.items())))
+    return _respuesta_condicional(html)
+
+# Páginas de catálogo ya renderizadas: {plantilla: (datos, raíz, html, html gzip)}
+_catalogos_html = {}
+# Se comprimen una sola vez por versión del catálogo, así que conviene el nivel máximo
+_NIVEL_GZIP_CATALOGO = 9
+
+def _render_catalogo(plantilla, **datos):
+    """
+    Renderiza una página de catálogo (sedes, carreras) y reutiliza el HTML
+    mientras el gestor de Excel devuelva los mismos objetos cacheados
+
+    Args:
+        plantilla: Nombre de la plantilla
+        **datos: Catálogos tal como los devuelve db (se comparan por identidad)
+
+    Returns:
+        Response: Respuesta 200 con ETag o 304 sin cuerpo
+    """
+    if _hay_flashes():
+        return render_template(plantilla, **datos)
+
+    raiz = request.script_root
+    previo = _catalogos_html.get(plantilla)
+    if (previo is None or previo[1] != raiz
+            or any(previo[0][clave] is not valor for clave, valor in datos.items())):
+        html = render_template(plantilla, **datos).encode('utf-8')
+        previo = (datos, raiz, html, gzip.compress(html, compresslevel=_NIVEL_GZIP_CATALOGO))
+        _catalogos_html[plantilla] = previo
+
+    respuesta = _respuesta_condicional(previo[2])
+    # El ETag ya se calculó sobre el HTML sin comprimir; comprimir_respuesta
+    # no vuelve a comprimir porque la respuesta ya trae Content-Encoding
+    if respuesta.status_code == 200 and 'gzip' in request.accept_encodings:
+        respuesta.set_data(previo[3])
+        respuesta.headers['Content-Encoding'] = 'gzip'
+        respuesta.vary.add('Accept-Encoding')
+    return respuesta
+
+def _render_condicional(plantilla, **contexto):
+    """
+    Renderiza una plantilla y la envía con ETag (ver _respuesta_condicional)
+
+    Args:
+        plantilla: Nombre de la plantilla
+        **contexto: Variables para la plantilla
+
+    Returns:
+        Response: Respuesta 200 con ETag o 304 sin cuerpo
+    """
+    return _respuesta_condicional(render_template(plantilla, **contexto))
+
+@lru_cache(maxsize=64)
+def _url_vista(endpoint, raiz):
+    """URL de una vista sin argumentos para una raíz de aplicación (SCRIPT_NAME)"""
+    return url_for(endpoint)
+
+def url_fija(endpoint):
+    """
+    url_for para vistas sin argumentos, resuelto una sola vez por proceso
+
+    Args:
+        endpoint: Nombre completo de la vista (ej: 'dashboard')
+
+    Returns:
+        str: URL de la vista
+    """
+    return _url_vista(endpoint, request.script_root)
+
+def _responder_error(mensaje, endpoint, codigo=400):
+    """
+    Responde un error: JSON para clientes que lo piden (sin redirección
+    ni reescritura de sesión) o flash + redirección para formularios HTML
+
+    Args:
+        mensaje: Texto del error
+        endpoint: Vista a la que redirigir en modo HTML
+        codigo: Código HTTP para la respuesta JSON
+
+    Returns:
+        Response: Respuesta JSON o redirección
+    """
+    if request.accept_mimetypes.best == 'application/json':
+        return {'exito': False, 'error': mensaje}, codigo
+    flash(mensaje, 'error')
+    return redirect(url_fija(endpoint))
+
+def obtener_registro(cedula):
+    """
+    Obtiene un registro nacional memorizándolo durante la petición actual,
+    para que varias consultas a la misma cédula no repitan la búsqueda
+
+    Args:
+        cedula: Número de cédula
+
+    Returns:
+        dict: Datos del registro o None si no existe
+    """
+    cache = g.setdefault('_registros', {})
+    if cedula not in cache:
+        cache[cedula] = db.obtener_registro_por_cedula(cedula)
+    return cache[cedula]
+
+
+def registro_del_usuario():
+    """
+    Registro nacional del usuario en sesión
+
+    No se carga en cargar_usuario: la mayoría de las vistas no lo necesitan,
+    así que se busca (una vez por petición) solo cuando una vista lo pide.
+
+    Returns:
+        dict: Datos del registro o None si no existe
+    """
+    return obtener_registro(g.user.cedula)
+
+
+def _olvidar_registros():
+    """Descarta los registros memorizados en la petición (tras modificarlos)"""
+    g.pop('_registros', None)
 
 # ========== RUTAS PÚBLICAS ==========
 
@@ -57,52 +601,36 @@ def login():
     cedula = request.form.get('usuario', '').strip()
     
     # Validar formato de cédula
-    if not cedula or len(cedula) != 10 or not cedula.isdigit():
-        flash('Cédula inválida. Debe contener exactamente 10 dígitos', 'error')
-        return redirect(url_for('index'))
-    
-    # Verificar si es administrador
-    if db.es_administrador(cedula):
-        admin_info = db.obtener_info_administrador(cedula)
-        session['cedula'] = cedula
-        session['nombre'] = admin_info['nombre_completo']
-        session['rol'] = 'ADMIN'
-        session['email'] = admin_info['email']
-        return redirect(url_for('dashboard'))
+    if not _CEDULA_RE.fullmatch(cedula):
+        return _responder_error('Cédula inválida. Debe contener exactamente 10 dígitos', 'index')
     
-    # Verificar si es estudiante registrado
-    elif db.existe_registro(cedula):
-        registro = db.obtener_registro_por_cedula(cedula)
-        nombre_completo = f"{registro['primer_nombre']} {registro['apellido_paterno']}"
-        session['cedula'] = cedula
-        session['nombre'] = nombre_completo
-        session['rol'] = 'ESTUDIANTE'
-        session['email'] = registro['correo']
-        session['estado'] = registro['estado']  # IMPORTANTE: Guardar estado
-        return redirect(url_for('dashboard'))
-    
-    else:
-        flash('Cédula no encontrada en el sistema', 'error')
-        return redirect(url_for('index'))
+    # Buscar en el índice de usuarios (administradores y estudiantes)
+    usuario = db.obtener_usuario(cedula)
+
+    if not usuario:
+        return _responder_error('Cédula no encontrada en el sistema', 'index', 404)
+
+    session.permanent = True  # expira a las PERMANENT_SESSION_LIFETIME del login
+    session['cedula'] = cedula
+    session['nombre'] = usuario['nombre']
+    session['rol'] = usuario['rol']
+    if usuario['rol'] == 'ESTUDIANTE':
+        session['estado'] = usuario['estado']  # IMPORTANTE: Guardar estado
+    return redirect(url_fija('dashboard'))
 
 @app.route('/logout')
 def logout():
     """Cierra la sesión del usuario"""
     session.clear()
     flash('Sesión cerrada exitosamente', 'info')
-    return redirect(url_for('index'))
+    return redirect(url_fija('index'))
 
 @app.route('/dashboard')
 def dashboard():
     """Dashboard principal - muestra opciones según el rol"""
-    if 'cedula' not in session:
-        return redirect(url_for('index'))
-    
-    return render_template('dashboard.html', 
-                         cedula=session['cedula'],
-                         nombre=session['nombre'],
-                         rol=session.get('rol', 'ESTUDIANTE'),
-                         estado=session.get('estado', 'PENDIENTE'))
+    usuario = g.user
+    return _respuesta_condicional(_dashboard_html(usuario.cedula, usuario.nombre, usuario.rol,
+                                                  usuario.estado, request.script_root))
 
 # ========================================
 # OPCIÓN 1: VER SEDES (Desde Excel)
@@ -110,25 +638,13 @@ def dashboard():
 @app.route('/opcion1')
 def opcion1():
     """Muestra todas las sedes desde la base de datos Excel"""
-    if 'cedula' not in session:
-        flash('Debe iniciar sesión', 'warning')
-        return redirect(url_for('index'))
-    
     try:
-        # Obtener sedes desde Excel
+        # Obtener sedes desde Excel (lista cacheada: el HTML se reutiliza mientras no cambie)
         sedes = db.obtener_todas_sedes()
         
-        if not sedes:
-            flash('No hay sedes registradas en el sistema', 'warning')
-        
-        return render_template('sedes.html',
-                             sedes=sedes,
-                             cedula=session.get('cedula'),
-                             nombre=session.get('nombre'),
-                             rol=session.get('rol'))
+        return _render_catalogo('sedes.html', sedes=sedes)
     except Exception as e:
-        flash(f'Error al cargar sedes: {str(e)}', 'error')
-        return redirect(url_for('dashboard'))
+        return _responder_error(f'Error al cargar sedes: {str(e)}', 'dashboard', 500)
 
 
 # ========================================
@@ -137,34 +653,18 @@ def opcion1():
 @app.route('/opcion2')
 def opcion2():
     """Muestra todas las carreras desde la base de datos Excel"""
-    if 'cedula' not in session:
-        flash('Debe iniciar sesión', 'warning')
-        return redirect(url_for('index'))
-    
     try:
         # Obtener carreras desde Excel
         carreras = db.obtener_todas_carreras()
         
-        if not carreras:
-            flash('No hay carreras registradas en el sistema', 'warning')
-        
-        # Agrupar por facultad
-        carreras_por_facultad = {}
-        for carrera in carreras:
-            facultad = carrera['facultad']
-            if facultad not in carreras_por_facultad:
-                carreras_por_facultad[facultad] = []
-            carreras_por_facultad[facultad].append(carrera)
+        # Agrupadas por facultad (precalculado en el gestor de Excel)
+        carreras_por_facultad = db.obtener_carreras_agrupadas()
         
-        return render_template('carreras.html',
-                             carreras=carreras,
-                             carreras_por_facultad=carreras_por_facultad,
-                             cedula=session.get('cedula'),
-                             nombre=session.get('nombre'),
-                             rol=session.get('rol'))
+        return _render_catalogo('carreras.html',
+                                carreras=carreras,
+                                carreras_por_facultad=carreras_por_facultad)
     except Exception as e:
-        flash(f'Error al cargar carreras: {str(e)}', 'error')
-        return redirect(url_for('dashboard'))
+        return _responder_error(f'Error al cargar carreras: {str(e)}', 'dashboard', 500)
 
 
 # ========================================
@@ -173,407 +673,218 @@ def opcion2():
 @app.route('/buscar_carreras', methods=['GET'])
 def buscar_carreras():
     """Busca carreras por facultad"""
-    if 'cedula' not in session:
-        return redirect(url_for('index'))
-    
     facultad = request.args.get('facultad', '')
-    
-    if facultad:
-        carreras = db.buscar_carreras_por_facultad(facultad)
-    else:
-        carreras = db.obtener_todas_carreras()
-    
-    return render_template('carreras.html',
-                         carreras=carreras,
-                         cedula=session.get('cedula'),
-                         nombre=session.get('nombre'),
-                         rol=session.get('rol'))
+    usuario = g.user
+    
+    # Sale del catálogo agrupado en memoria (sin recorrer el Excel)
+    carreras = db.buscar_carreras_por_facultad(facultad)
+    
+    respuesta = make_response(render_template('carreras.html',
+                                              carreras=carreras,
+                                              cedula=usuario.cedula,
+                                              nombre=usuario.nombre,
+                                              rol=usuario.rol))
+    # La página lleva el nombre del usuario: solo cacheable en su navegador
+    respuesta.cache_control.private = True
+    respuesta.cache_control.max_age = ExcelManager.CATALOGO_TTL
+    return respuesta
+
+# ========== TRÁMITES DEL POSTULANTE (OPCIONES 3, 5, 6 Y 7) ==========
+
+# Registro, inscripción, evaluación y asignación: comparten blueprint y se
+# enlazan con url_for('tramites.<vista>') (o '.<vista>' dentro del blueprint)
+tramites = Blueprint('tramites', __name__)
+
+def _texto_mayusculas(valor):
+    """Quita espacios de los extremos y pasa a mayúsculas"""
+    return valor.strip().upper()
+
+
+def _texto_minusculas(valor):
+    """Quita espacios de los extremos y pasa a minúsculas"""
+    return valor.strip().lower()
+
+
+# Campos del formulario de registro: (nombre, valor por defecto, normalización)
+_CAMPOS_REGISTRO = (
+    ('primer_nombre', '', _texto_mayusculas),
+    ('segundo_nombre', '', _texto_mayusculas),
+    ('apellido_paterno', '', _texto_mayusculas),
+    ('apellido_materno', '', _texto_mayusculas),
+    ('correo', '', _texto_minusculas),
+    ('celular', '', str.strip),
+    ('calificacion', '0', None),
+    ('cuadro_honor', 'NO', None),
+    ('estado', 'PENDIENTE', None),
+)
+
+
+def _leer_formulario_registro(formulario, con_cedula=False):
+    """
+    Extrae y normaliza los campos del formulario de registro nacional
+
+    La validación completa la hace ExcelManager al insertar o actualizar.
+
+    Args:
+        formulario: request.form
+        con_cedula: Incluir la cédula (solo al crear)
+
+    Returns:
+        dict: Datos listos para insertar_registro / actualizar_registro
+    """
+    datos = {'cedula': formulario.get('cedula', '').strip()} if con_cedula else {}
+    for campo, defecto, normalizar in _CAMPOS_REGISTRO:
+        valor = formulario.get(campo, defecto)
+        datos[campo] = normalizar(valor) if normalizar else valor
+    return datos
 
 # ========== OPCIÓN 3: VERIFICAR REGISTRO (CON CRUD PARA ADMIN) ==========
 
-@app.route('/opcion3', methods=['GET', 'POST'])
+@tramites.route('/opcion3', methods=['GET', 'POST'])
 def opcion3():
     """
     Verificar Registro Nacional
     - Estudiante: Solo ve su información (sin opciones de crear/editar)
     - Administrador: CRUD completo (Insertar, Modificar, Eliminar)
     """
-    if 'cedula' not in session:
-        return redirect(url_for('index'))
-    
-    rol = session.get('rol', 'ESTUDIANTE')
+    usuario = g.user
+    rol = usuario.rol
     
     # POST: Buscar registro por cédula
     if request.method == 'POST':
         cedula_buscar = request.form.get('cedula_buscar', '').strip()
         
-        if not cedula_buscar:
-            flash('Debe ingresar una cédula', 'error')
-            return redirect(url_for('opcion3'))
+        # Rechazar formatos inválidos antes de consultar el Excel
+        if not _CEDULA_RE.fullmatch(cedula_buscar):
+            flash('Debe ingresar una cédula de 10 dígitos', 'error')
+            return redirect(url_fija('tramites.opcion3'))
         
-        registro = db.obtener_registro_por_cedula(cedula_buscar)
+        registro = obtener_registro(cedula_buscar)
         
         if not registro:
             flash('Registro no encontrado en la base de datos', 'error')
             # ADMIN puede crear, ESTUDIANTE no
             if rol == 'ADMIN':
-                return redirect(url_for('opcion3_crear', cedula=cedula_buscar))
+                return redirect(url_for('.opcion3_crear', cedula=cedula_buscar))
             else:
-                return redirect(url_for('opcion3'))
+                return redirect(url_fija('tramites.opcion3'))
         
         # Mostrar registro encontrado
         nombre_completo = f"{registro['primer_nombre']} {registro.get('segundo_nombre', '')} {registro['apellido_paterno']} {registro['apellido_materno']}".strip()
         
-        html = f"""
-        <style>
-            body {{ font-family: Arial; background: #f5f5f5; padding: 20px; }}
-            .container {{ max-width: 800px; margin: 0 auto; background: white; padding: 30px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-            .info-row {{ padding: 10px; border-bottom: 1px solid #eee; }}
-            .btn {{ background: #667eea; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px; display: inline-block; margin: 5px; border: none; cursor: pointer; }}
-            .btn-danger {{ background: #dc3545; }}
-            .btn:hover {{ opacity: 0.9; }}
-            h1 {{ color: #333; }}
-            .label {{ font-weight: bold; color: #555; }}
-            .estado-completo {{ color: green; font-weight: bold; }}
-            .estado-pendiente {{ color: orange; font-weight: bold; }}
-        </style>
-        <div class='container'>
-            <h1>✅ Registro Encontrado</h1>
-            <div class='info-row'><span class='label'>Nombre Completo:</span> {nombre_completo}</div>
-            <div class='info-row'><span class='label'>Cédula:</span> {registro['cedula']}</div>
-            <div class='info-row'><span class='label'>Email:</span> {registro['correo']}</div>
-            <div class='info-row'><span class='label'>Celular:</span> {registro['celular']}</div>
-            <div class='info-row'><span class='label'>Calificación:</span> {registro['calificacion']}/10</div>
-            <div class='info-row'><span class='label'>Cuadro de Honor:</span> {registro['cuadro_honor']}</div>
-            <div class='info-row'><span class='label'>Estado:</span> <span class='estado-{'completo' if registro['estado'] == 'COMPLETO' else 'pendiente'}'>{registro['estado']}</span></div>
-            <div class='info-row'><span class='label'>Fecha Registro:</span> {registro['fecha_registro']}</div>
-            <br>
-        """
-        
-        # Solo ADMIN puede editar/eliminar
-        if rol == 'ADMIN':
-            html += f"""
-            <a href='/opcion3_editar/{registro['cedula']}' class='btn'>✏️ Modificar</a>
-            <a href='/opcion3_eliminar/{registro['cedula']}' class='btn btn-danger' onclick="return confirm('¿Está seguro de eliminar este registro?')">🗑️ Eliminar</a>
-            """
-        
-        html += """
-            <a href='/opcion3' class='btn'>← Nueva búsqueda</a>
-            <a href='/dashboard' class='btn'>← Volver al menú</a>
-        </div>
-        """
-        
-        return html
+        return render_template('registro_detalle.html',
+                             registro=registro,
+                             nombre_completo=nombre_completo,
+                             rol=rol)
     
     # GET: Mostrar formulario de búsqueda
     # Si es ESTUDIANTE, pre-llenar con su cédula
-    cedula_default = session['cedula'] if rol == 'ESTUDIANTE' else ''
-    
-    html = f"""
-    <style>
-        body {{ font-family: Arial; background: #f5f5f5; padding: 20px; }}
-        .container {{ max-width: 600px; margin: 0 auto; background: white; padding: 30px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-        input[type='text'] {{ width: 100%; padding: 12px; margin: 10px 0; border: 1px solid #ddd; border-radius: 5px; box-sizing: border-box; }}
-        .btn {{ background: #667eea; color: white; padding: 12px 24px; border: none; border-radius: 5px; cursor: pointer; width: 100%; font-size: 16px; }}
-        .btn:hover {{ background: #5568d3; }}
-        .btn-secondary {{ background: #6c757d; margin-top: 10px; }}
-        h1 {{ color: #333; }}
-    </style>
-    <div class='container'>
-        <h1>🔍 Verificar Registro Nacional</h1>
-        <p>Busca registros en la base de datos Excel</p>
-        <form method='POST'>
-            <label><strong>Ingrese número de cédula:</strong></label>
-            <input type='text' name='cedula_buscar' required pattern='[0-9]{{10}}' 
-                   placeholder='Ej: 1316202082' value='{cedula_default}'>
-            <button type='submit' class='btn'>Buscar en Base de Datos</button>
-        </form>
-    """
-    
-    # Solo ADMIN puede crear nuevos registros
-    if rol == 'ADMIN':
-        html += """
-        <br>
-        <a href='/opcion3_crear' class='btn btn-secondary' style='text-decoration: none; display: block; text-align: center;'>➕ Crear Nuevo Registro</a>
-        """
-    
-    html += """
-        <br>
-        <a href='/dashboard' class='btn btn-secondary' style='text-decoration: none; display: block; text-align: center;'>← Volver al menú</a>
-    </div>
-    """
+    cedula_default = usuario.cedula if rol == 'ESTUDIANTE' else ''
     
-    return html
+    return _render_formulario('registro_buscar.html',
+                              cedula_default=cedula_default,
+                              rol=rol)
 
-@app.route('/opcion3_crear', methods=['GET', 'POST'])
+@tramites.route('/opcion3_crear', methods=['GET', 'POST'])
+@requiere_admin('Acceso denegado. Solo administradores pueden crear registros.')
 def opcion3_crear():
     """Crear nuevo registro (solo Admin)"""
-    if session.get('rol') != 'ADMIN':
-        flash('Acceso denegado. Solo administradores pueden crear registros.', 'error')
-        return redirect(url_for('dashboard'))
-    
     if request.method == 'POST':
-        datos = {
-            'cedula': request.form.get('cedula', '').strip(),
-            'primer_nombre': request.form.get('primer_nombre', '').strip().upper(),
-            'segundo_nombre': request.form.get('segundo_nombre', '').strip().upper(),
-            'apellido_paterno': request.form.get('apellido_paterno', '').strip().upper(),
-            'apellido_materno': request.form.get('apellido_materno', '').strip().upper(),
-            'correo': request.form.get('correo', '').strip().lower(),
-            'celular': request.form.get('celular', '').strip(),
-            'calificacion': request.form.get('calificacion', '0'),
-            'cuadro_honor': request.form.get('cuadro_honor', 'NO'),
-            'estado': request.form.get('estado', 'PENDIENTE')
-        }
+        datos = _leer_formulario_registro(request.form, con_cedula=True)
         
         exito, mensaje = db.insertar_registro(datos)
+        _olvidar_registros()
         
         if exito:
             flash(mensaje, 'success')
-            return redirect(url_for('opcion3'))
+            return redirect(url_fija('tramites.opcion3'))
         else:
             flash(mensaje, 'error')
     
     cedula_param = request.args.get('cedula', '')
     
-    return f"""
-    <style>
-        body {{ font-family: Arial; background: #f5f5f5; padding: 20px; }}
-        .container {{ max-width: 700px; margin: 0 auto; background: white; padding: 30px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-        input, select {{ width: 100%; padding: 10px; margin: 8px 0; border: 1px solid #ddd; border-radius: 5px; box-sizing: border-box; }}
-        .btn {{ background: #667eea; color: white; padding: 12px 24px; border: none; border-radius: 5px; cursor: pointer; width: 100%; font-size: 16px; margin-top: 10px; }}
-        .btn:hover {{ background: #5568d3; }}
-        .btn-secondary {{ background: #6c757d; }}
-        label {{ font-weight: bold; color: #555; margin-top: 10px; display: block; }}
-        h1 {{ color: #333; }}
-    </style>
-    <div class='container'>
-        <h1>➕ Crear Nuevo Registro</h1>
-        <form method='POST'>
-            <label>Cédula: *</label>
-            <input type='text' name='cedula' required pattern='[0-9]{{10}}' placeholder='10 dígitos' value='{cedula_param}'>
-            
-            <label>Primer Nombre: *</label>
-            <input type='text' name='primer_nombre' required>
-            
-            <label>Segundo Nombre:</label>
-            <input type='text' name='segundo_nombre'>
-            
-            <label>Apellido Paterno: *</label>
-            <input type='text' name='apellido_paterno' required>
-            
-            <label>Apellido Materno: *</label>
-            <input type='text' name='apellido_materno' required>
-            
-            <label>Email: *</label>
-            <input type='email' name='correo' required placeholder='ejemplo@correo.com'>
-            
-            <label>Celular: *</label>
-            <input type='text' name='celular' required pattern='[0-9]{{10}}' placeholder='10 dígitos'>
-            
-            <label>Calificación (0-10): *</label>
-            <input type='number' name='calificacion' required min='0' max='10' step='0.01' value='0'>
-            
-            <label>Cuadro de Honor:</label>
-            <select name='cuadro_honor'>
-                <option value='NO'>NO</option>
-                <option value='SI'>SI</option>
-            </select>
-            
-            <label>Estado:</label>
-            <select name='estado'>
-                <option value='PENDIENTE'>PENDIENTE</option>
-                <option value='COMPLETO'>COMPLETO</option>
-            </select>
-            
-            <button type='submit' class='btn'>💾 Guardar</button>
-            <a href='/opcion3' class='btn btn-secondary' style='text-decoration: none; display: block; text-align: center;'>← Cancelar</a>
-        </form>
-    </div>
-    """
+    return render_template('registro_form.html', registro=None, cedula_param=cedula_param)
 
-@app.route('/opcion3_editar/<cedula>', methods=['GET', 'POST'])
+@tramites.route('/opcion3_editar/<cedula>', methods=['GET', 'POST'])
+@requiere_admin()
 def opcion3_editar(cedula):
     """Editar registro existente (solo Admin)"""
-    if session.get('rol') != 'ADMIN':
-        flash('Acceso denegado', 'error')
-        return redirect(url_for('dashboard'))
-    
-    registro = db.obtener_registro_por_cedula(cedula)
+    registro = obtener_registro(cedula)
     if not registro:
         flash('Registro no encontrado', 'error')
-        return redirect(url_for('opcion3'))
+        return redirect(url_fija('tramites.opcion3'))
     
     if request.method == 'POST':
-        datos = {
-            'primer_nombre': request.form.get('primer_nombre', '').strip().upper(),
-            'segundo_nombre': request.form.get('segundo_nombre', '').strip().upper(),
-            'apellido_paterno': request.form.get('apellido_paterno', '').strip().upper(),
-            'apellido_materno': request.form.get('apellido_materno', '').strip().upper(),
-            'correo': request.form.get('correo', '').strip().lower(),
-            'celular': request.form.get('celular', '').strip(),
-            'calificacion': request.form.get('calificacion', '0'),
-            'cuadro_honor': request.form.get('cuadro_honor', 'NO'),
-            'estado': request.form.get('estado', 'PENDIENTE')
-        }
+        datos = _leer_formulario_registro(request.form)
         
         exito, mensaje = db.actualizar_registro(cedula, datos)
+        _olvidar_registros()
         
         if exito:
             flash(mensaje, 'success')
-            return redirect(url_for('opcion3'))
+            return redirect(url_fija('tramites.opcion3'))
         else:
             flash(mensaje, 'error')
     
-    return f"""
-    <style>
-        body {{ font-family: Arial; background: #f5f5f5; padding: 20px; }}
-        .container {{ max-width: 700px; margin: 0 auto; background: white; padding: 30px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-        input, select {{ width: 100%; padding: 10px; margin: 8px 0; border: 1px solid #ddd; border-radius: 5px; box-sizing: border-box; }}
-        .btn {{ background: #667eea; color: white; padding: 12px 24px; border: none; border-radius: 5px; cursor: pointer; width: 100%; font-size: 16px; margin-top: 10px; }}
-        .btn:hover {{ background: #5568d3; }}
-        .btn-secondary {{ background: #6c757d; }}
-        label {{ font-weight: bold; color: #555; margin-top: 10px; display: block; }}
-        h1 {{ color: #333; }}
-    </style>
-    <div class='container'>
-        <h1>✏️ Modificar Registro</h1>
-        <p><strong>Cédula:</strong> {registro['cedula']} (no modificable)</p>
-        <form method='POST'>
-            <label>Primer Nombre: *</label>
-            <input type='text' name='primer_nombre' required value='{registro['primer_nombre']}'>
-            
-            <label>Segundo Nombre:</label>
-            <input type='text' name='segundo_nombre' value='{registro.get('segundo_nombre', '')}'>
-            
-            <label>Apellido Paterno: *</label>
-            <input type='text' name='apellido_paterno' required value='{registro['apellido_paterno']}'>
-            
-            <label>Apellido Materno: *</label>
-            <input type='text' name='apellido_materno' required value='{registro['apellido_materno']}'>
-            
-            <label>Email: *</label>
-            <input type='email' name='correo' required value='{registro['correo']}'>
-            
-            <label>Celular: *</label>
-            <input type='text' name='celular' required pattern='[0-9]{{10}}' value='{registro['celular']}'>
-            
-            <label>Calificación (0-10): *</label>
-            <input type='number' name='calificacion' required min='0' max='10' step='0.01' value='{registro['calificacion']}'>
-            
-            <label>Cuadro de Honor:</label>
-            <select name='cuadro_honor'>
-                <option value='NO' {'selected' if registro['cuadro_honor'] == 'NO' else ''}>NO</option>
-                <option value='SI' {'selected' if registro['cuadro_honor'] == 'SI' else ''}>SI</option>
-            </select>
-            
-            <label>Estado:</label>
-            <select name='estado'>
-                <option value='PENDIENTE' {'selected' if registro['estado'] == 'PENDIENTE' else ''}>PENDIENTE</option>
-                <option value='COMPLETO' {'selected' if registro['estado'] == 'COMPLETO' else ''}>COMPLETO</option>
-            </select>
-            
-            <button type='submit' class='btn'>💾 Actualizar</button>
-            <a href='/opcion3' class='btn btn-secondary' style='text-decoration: none; display: block; text-align: center;'>← Cancelar</a>
-        </form>
-    </div>
-    """
+    return render_template('registro_form.html', registro=registro)
 
-@app.route('/opcion3_eliminar/<cedula>')
+@tramites.route('/opcion3_eliminar/<cedula>')
+@requiere_admin()
 def opcion3_eliminar(cedula):
     """Eliminar registro (solo Admin)"""
-    if session.get('rol') != 'ADMIN':
-        flash('Acceso denegado', 'error')
-        return redirect(url_for('dashboard'))
-    
     exito, mensaje = db.eliminar_registro(cedula)
+    _olvidar_registros()
     
     if exito:
         flash(mensaje, 'success')
     else:
         flash(mensaje, 'error')
     
-    return redirect(url_for('opcion3'))
+    return redirect(url_fija('tramites.opcion3'))
 
 # ========== OPCIÓN 4: VER TODOS LOS POSTULANTES ==========
 
 @app.route('/opcion4')
 def opcion4():
-    """Lista todos los postulantes registrados"""
-    if 'cedula' not in session:
-        return redirect(url_for('index'))
-    
-    registros = db.listar_todos_registros()
-    
-    html = """
-    <style>
-        body { font-family: Arial; background: #f5f5f5; padding: 20px; }
-        .postulante-card { background: white; padding: 20px; margin: 15px; border-radius: 10px; 
-                          box-shadow: 0 2px 5px rgba(0,0,0,0.1); border-left: 5px solid #667eea; }
-        .btn { background: #667eea; color: white; padding: 10px 20px; text-decoration: none; 
-              border-radius: 5px; display: inline-block; margin: 10px 5px; }
-        .btn:hover { background: #5568d3; }
-        .estado-completo { color: green; font-weight: bold; }
-        .estado-pendiente { color: orange; font-weight: bold; }
-    </style>
-    <h1>👥 Lista de Postulantes Registrados</h1>
-    """
-    
-    for reg in registros:
-        nombre_completo = f"{reg['primer_nombre']} {reg['apellido_paterno']}"
-        clase_estado = 'estado-completo' if reg['estado'] == 'COMPLETO' else 'estado-pendiente'
-        
-        html += f"""
-        <div class='postulante-card'>
-            <h3>{nombre_completo}</h3>
-            <p><strong>Cédula:</strong> {reg['cedula']}</p>
-            <p><strong>Email:</strong> {reg['correo']}</p>
-            <p><strong>Estado:</strong> <span class='{clase_estado}'>{reg['estado']}</span></p>
-        </div>
-        """
-    
-    html += f"<br><p><strong>Total de registros:</strong> {len(registros)}</p>"
-    html += "<br><a href='/dashboard' class='btn'>← Volver al menú</a>"
-    return html
+    """Lista los postulantes registrados, paginados con ?pagina=N"""
+    por_pagina = app.config['POSTULANTES_POR_PAGINA']
+    pagina = max(request.args.get('pagina', 1, type=int), 1)
+    
+    # Solo se convierten y renderizan los registros de la página pedida
+    registros, total = db.listar_registros(offset=(pagina - 1) * por_pagina, limite=por_pagina)
+    total_paginas = max((total + por_pagina - 1) // por_pagina, 1)
+    if pagina > total_paginas:
+        return redirect(url_for('opcion4', pagina=total_paginas))
+    
+    tarjetas = (_tarjeta_postulante(reg['cedula'], reg['primer_nombre'], reg['apellido_paterno'],
+                                    reg['correo'], reg['estado'])
+                for reg in registros)
+    # stream_template envía cada tarjeta a medida que se genera (no arma todo el HTML en memoria)
+    return stream_template('postulantes.html',
+                           tarjetas=tarjetas,
+                           total=total,
+                           pagina=pagina,
+                           total_paginas=total_paginas)
 
 # ========== OPCIÓN 5: CREAR INSCRIPCIÓN (CON VALIDACIÓN DE ESTADO) ==========
 
-@app.route('/opcion5', methods=['GET', 'POST'])
+@tramites.route('/opcion5', methods=['GET', 'POST'])
 def opcion5():
     """Crear inscripción a carrera - SOLO si estado es COMPLETO"""
-    if 'cedula' not in session:
-        return redirect(url_for('index'))
-    
-    cedula = session.get('cedula')
-    registro = db.obtener_registro_por_cedula(cedula)
+    cedula = g.user.cedula
+    registro = registro_del_usuario()
     
     # VALIDAR ESTADO COMPLETO
     if registro['estado'] != 'COMPLETO':
         flash(f'❌ No puede inscribirse. Su estado es: {registro["estado"]}. Debe tener estado COMPLETO.', 'error')
-        return redirect(url_for('dashboard'))
+        return redirect(url_fija('dashboard'))
     
     if request.method == 'POST':
         carrera_id = request.form.get('carrera_id')
         jornada_num = request.form.get('jornada')
         
-        # Mapear jornadas
-        jornadas = {
-            '1': 'Matutina',
-            '2': 'Vespertina',
-            '3': 'Nocturna'
-        }
-        
-        # Mapear carreras
-        carreras_dict = {
-            '101': 'Tecnologías de Información',
-            '102': 'Medicina',
-            '103': 'Ingeniería Civil',
-            '104': 'Administración',
-            '105': 'Derecho'
-        }
-        
-        jornada = jornadas.get(jornada_num, 'Matutina')
-        carrera_nombre = carreras_dict.get(carrera_id, 'No especificada')
+        jornada = _JORNADAS.get(jornada_num, 'Matutina')
+        carrera_nombre = _CARRERAS.get(int(carrera_id), 'No especificada')
         
         # Insertar inscripción
         datos_inscripcion = {
@@ -592,108 +903,41 @@ def opcion5():
             datos_insc = db.obtener_inscripcion_por_cedula(cedula)
             
             try:
-                email_service.enviar_confirmacion_inscripcion(
-                    registro['correo'],
-                    datos_estudiante,
-                    datos_insc
-                )
-                flash(f'Inscripción confirmada. Se envió un correo a {registro["correo"]}', 'success')
+                enviar_correo_async('enviar_confirmacion_inscripcion',
+                                    registro['correo'],
+                                    datos_estudiante,
+                                    datos_insc)
+                flash(f'Inscripción confirmada. Se enviará un correo a {registro["correo"]}', 'success')
             except Exception as e:
                 flash(f'Inscripción confirmada, pero no se pudo enviar el correo: {str(e)}', 'warning')
             
-            return redirect(url_for('opcion5_confirmacion'))
+            return redirect(url_fija('tramites.opcion5_confirmacion'))
         else:
             flash(mensaje, 'error')
     
-    return """
-    <style>
-        body { font-family: Arial; background: #f5f5f5; padding: 20px; }
-        .container { max-width: 600px; margin: 0 auto; background: white; padding: 30px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
-        select { width: 100%; padding: 12px; margin: 10px 0; border: 1px solid #ddd; border-radius: 5px; }
-        .btn { background: #667eea; color: white; padding: 12px 24px; border: none; border-radius: 5px; cursor: pointer; width: 100%; font-size: 16px; }
-        .btn:hover { background: #5568d3; }
-        .btn-secondary { background: #6c757d; margin-top: 10px; }
-        label { font-weight: bold; color: #555; margin-top: 10px; display: block; }
-    </style>
-    <div class='container'>
-        <h1>📝 Crear Inscripción</h1>
-        <div style='background: #d4edda; padding: 15px; border-radius: 5px; margin-bottom: 20px;'>
-            ✅ <strong>Estado verificado: COMPLETO</strong>
-        </div>
-        <form method='POST'>
-            <label>Seleccione una carrera:</label>
-            <select name='carrera_id' required>
-                <option value=''>-- Seleccione --</option>
-                <option value='101'>101 - Tecnologías de Información</option>
-                <option value='102'>102 - Medicina</option>
-                <option value='103'>103 - Ingeniería Civil</option>
-                <option value='104'>104 - Administración</option>
-                <option value='105'>105 - Derecho</option>
-            </select>
-            
-            <label>Seleccione jornada:</label>
-            <select name='jornada' required>
-                <option value=''>-- Seleccione --</option>
-                <option value='1'>Matutina (07:00 - 12:00)</option>
-                <option value='2'>Vespertina (13:00 - 18:00)</option>
-                <option value='3'>Nocturna (18:00 - 22:00)</option>
-            </select>
-            
-            <button type='submit' class='btn'>Confirmar Inscripción</button>
-        </form>
-        <br>
-        <a href='/dashboard' class='btn btn-secondary' style='text-decoration: none; display: block; text-align: center;'>← Volver al menú</a>
-    </div>
-    """
+    return _render_formulario('inscripcion_form.html')
 
-@app.route('/opcion5_confirmacion')
+@tramites.route('/opcion5_confirmacion')
 def opcion5_confirmacion():
     """Muestra confirmación de inscripción"""
-    if 'cedula' not in session:
-        return redirect(url_for('index'))
-    
-    cedula = session.get('cedula')
+    cedula = g.user.cedula
     inscripcion = db.obtener_inscripcion_por_cedula(cedula)
     
     if not inscripcion:
         flash('No se encontró inscripción', 'error')
-        return redirect(url_for('opcion5'))
+        return redirect(url_fija('tramites.opcion5'))
     
-    return f"""
-    <style>
-        body {{ font-family: Arial; background: #f5f5f5; padding: 20px; }}
-        .container {{ max-width: 700px; margin: 0 auto; background: white; padding: 30px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-        .success-box {{ background: #d4edda; border: 1px solid #c3e6cb; color: #155724; padding: 20px; border-radius: 5px; margin: 20px 0; }}
-        .info-row {{ padding: 10px; border-bottom: 1px solid #eee; }}
-        .btn {{ background: #667eea; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px; display: inline-block; margin: 5px; }}
-    </style>
-    <div class='container'>
-        <h1>✅ Inscripción Confirmada</h1>
-        <div class='success-box'>
-            <h3>¡Su inscripción ha sido registrada exitosamente!</h3>
-            <p>Se ha enviado un correo de confirmación a su email registrado.</p>
-        </div>
-        <div class='info-row'><strong>Carrera:</strong> {inscripcion['carrera_nombre']}</div>
-        <div class='info-row'><strong>Jornada:</strong> {inscripcion['jornada']}</div>
-        <div class='info-row'><strong>Estado:</strong> {inscripcion['estado']}</div>
-        <div class='info-row'><strong>Fecha:</strong> {inscripcion['fecha_inscripcion']}</div>
-        <br>
-        <a href='/dashboard' class='btn'>← Volver al menú</a>
-    </div>
-    """
+    return render_template('inscripcion_confirmacion.html', inscripcion=inscripcion)
 
 # ========== OPCIÓN 6: VERIFICAR EVALUACIÓN ==========
 
-@app.route('/opcion6', methods=['GET', 'POST'])
+@tramites.route('/opcion6', methods=['GET', 'POST'])
 def opcion6():
     """Verificar evaluación del postulante"""
-    if 'cedula' not in session:
-        return redirect(url_for('index'))
-    
     # ESTUDIANTE solo ve su evaluación
     # ADMIN puede buscar cualquier cédula
-    rol = session.get('rol')
-    cedula_sesion = session.get('cedula')
+    usuario = g.user
+    rol, cedula_sesion = usuario.rol, usuario.cedula
     
     if request.method == 'POST':
         cedula = request.form.get('cedula', '').strip()
@@ -703,93 +947,53 @@ def opcion6():
             flash('Solo puede ver su propia evaluación', 'error')
             cedula = cedula_sesion
         
-        if not db.existe_registro(cedula):
-            flash('Cédula no encontrada', 'error')
-            return redirect(url_for('opcion6'))
+        if not _CEDULA_RE.fullmatch(cedula):
+            flash('Cédula inválida. Debe tener 10 dígitos', 'error')
+            return redirect(url_fija('tramites.opcion6'))
         
-        evaluacion = db.obtener_evaluacion_por_cedula(cedula)
+        # Registro y evaluación en una sola consulta al Excel
+        registro, evaluacion = db.obtener_registro_con_evaluacion(cedula)
+        
+        if registro is None:
+            flash('Cédula no encontrada', 'error')
+            return redirect(url_fija('tramites.opcion6'))
         
         if not evaluacion:
             flash('No se encontró evaluación para esta cédula', 'warning')
-            return redirect(url_for('opcion6'))
-        
-        registro = db.obtener_registro_por_cedula(cedula)
-        nombre_completo = f"{registro['primer_nombre']} {registro['apellido_paterno']}"
+            return redirect(url_fija('tramites.opcion6'))
         
         # Enviar correo con resultados
         try:
-            email_service.enviar_confirmacion_evaluacion(
-                registro['correo'],
-                registro,
-                evaluacion
-            )
-            mensaje_correo = f"✅ Resultados enviados a {registro['correo']}"
+            enviar_correo_async('enviar_confirmacion_evaluacion',
+                                registro['correo'],
+                                registro,
+                                evaluacion)
+            mensaje_correo = f"✅ Los resultados se están enviando a {registro['correo']}"
         except Exception as e:
             mensaje_correo = f"⚠️ No se pudo enviar el correo: {str(e)}"
         
-        return f"""
-        <style>
-            body {{ font-family: Arial; background: #f5f5f5; padding: 20px; }}
-            .container {{ max-width: 700px; margin: 0 auto; background: white; padding: 30px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-            .info-row {{ padding: 10px; border-bottom: 1px solid #eee; }}
-            .btn {{ background: #667eea; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px; display: inline-block; margin: 5px; }}
-            .success {{ color: green; font-weight: bold; }}
-        </style>
-        <div class='container'>
-            <h1>📝 Resultados de Evaluación</h1>
-            <h3>{nombre_completo}</h3>
-            <div class='info-row'><strong>Cédula:</strong> {cedula}</div>
-            <div class='info-row'><strong>Email:</strong> {registro['correo']}</div>
-            <hr>
-            <h3>Resultados:</h3>
-            <div class='info-row'><strong>Razonamiento Verbal:</strong> {evaluacion['nota_verbal']}/10</div>
-            <div class='info-row'><strong>Razonamiento Numérico:</strong> {evaluacion['nota_numerica']}/10</div>
-            <div class='info-row'><strong>Razonamiento Abstracto:</strong> {evaluacion['nota_abstracta']}/10</div>
-            <div class='info-row'><strong>Puntaje Total:</strong> <span class='success'>{evaluacion['puntaje_total']}/1000</span></div>
-            <div class='info-row'><strong>Estado:</strong> {evaluacion['estado']}</div>
-            <br>
-            <p><em>{mensaje_correo}</em></p>
-            <a href='/opcion6' class='btn'>← Nueva consulta</a>
-            <a href='/dashboard' class='btn'>← Volver al menú</a>
-        </div>
-        """
+        return render_template('evaluacion_resultado.html',
+                             registro=registro,
+                             cedula=cedula,
+                             evaluacion=evaluacion,
+                             mensaje_correo=mensaje_correo)
     
-    # GET: Formulario (pre-llenar si es ESTUDIANTE)
     cedula_default = cedula_sesion if rol == 'ESTUDIANTE' else ''
-    readonly = "readonly" if rol == 'ESTUDIANTE' else ""
     
-    return f"""
-    <style>
-        body {{ font-family: Arial; background: #f5f5f5; padding: 20px; }}
-        .container {{ max-width: 600px; margin: 0 auto; background: white; padding: 30px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-        input[type='text'] {{ width: 100%; padding: 12px; margin: 10px 0; border: 1px solid #ddd; border-radius: 5px; box-sizing: border-box; }}
-        .btn {{ background: #667eea; color: white; padding: 12px 24px; border: none; border-radius: 5px; cursor: pointer; width: 100%; font-size: 16px; }}
-        .btn:hover {{ background: #5568d3; }}
-        .btn-secondary {{ background: #6c757d; margin-top: 10px; }}
-    </style>
-    <div class='container'>
-        <h1>📝 Verificar Evaluación</h1>
-        <form method='POST'>
-            <label><strong>Ingrese cédula:</strong></label>
-            <input type='text' name='cedula' required pattern='[0-9]{{10}}' 
-                   placeholder='Ej: 1316202082' value='{cedula_default}' {readonly}>
-            <button type='submit' class='btn'>Verificar</button>
-        </form>
-        <br>
-        <a href='/dashboard' class='btn btn-secondary' style='text-decoration: none; display: block; text-align: center;'>← Volver al menú</a>
-    </div>
-    """
+    return _render_formulario('consulta_cedula.html',
+                              titulo='Verificar Evaluación',
+                              icono='📝',
+                              boton='Verificar',
+                              cedula_default=cedula_default,
+                              solo_lectura=rol == 'ESTUDIANTE')
 
 # ========== OPCIÓN 7: CONSULTAR ASIGNACIÓN ==========
 
-@app.route('/opcion7', methods=['GET', 'POST'])
+@tramites.route('/opcion7', methods=['GET', 'POST'])
 def opcion7():
     """Consultar asignación de laboratorio"""
-    if 'cedula' not in session:
-        return redirect(url_for('index'))
-    
-    rol = session.get('rol')
-    cedula_sesion = session.get('cedula')
+    usuario = g.user
+    rol, cedula_sesion = usuario.rol, usuario.cedula
     
     if request.method == 'POST':
         cedula = request.form.get('cedula', '').strip()
@@ -799,184 +1003,89 @@ def opcion7():
             flash('Solo puede ver su propia asignación', 'error')
             cedula = cedula_sesion
         
-        if not db.existe_registro(cedula):
-            flash('Cédula no encontrada', 'error')
-            return redirect(url_for('opcion7'))
+        if not _CEDULA_RE.fullmatch(cedula):
+            flash('Cédula inválida. Debe tener 10 dígitos', 'error')
+            return redirect(url_fija('tramites.opcion7'))
         
-        asignacion = db.obtener_asignacion_por_cedula(cedula)
+        # Registro y asignación en una sola consulta al Excel
+        registro, asignacion = db.obtener_registro_con_asignacion(cedula)
+        
+        if registro is None:
+            flash('Cédula no encontrada', 'error')
+            return redirect(url_fija('tramites.opcion7'))
         
         if not asignacion:
             flash('No se encontró asignación para esta cédula', 'warning')
-            return redirect(url_for('opcion7'))
-        
-        registro = db.obtener_registro_por_cedula(cedula)
-        nombre_completo = f"{registro['primer_nombre']} {registro['apellido_paterno']}"
+            return redirect(url_fija('tramites.opcion7'))
         
         # Enviar correo con asignación
         try:
-            email_service.enviar_asignacion_laboratorio(
-                registro['correo'],
-                registro,
-                asignacion
-            )
-            mensaje_correo = f"✅ Asignación enviada a {registro['correo']}"
+            enviar_correo_async('enviar_asignacion_laboratorio',
+                                registro['correo'],
+                                registro,
+                                asignacion)
+            mensaje_correo = f"✅ La asignación se está enviando a {registro['correo']}"
         except Exception as e:
             mensaje_correo = f"⚠️ No se pudo enviar el correo: {str(e)}"
         
-        # Mapeo de carreras
-        carreras = {
-            101: 'Tecnologías de Información',
-            102: 'Medicina',
-            103: 'Ingeniería Civil',
-            104: 'Administración',
-            105: 'Derecho'
-        }
-        
-        carrera_nombre = carreras.get(asignacion['carrera_id'], 'No especificada')
+        carrera_nombre = _CARRERAS.get(asignacion['carrera_id'], 'No especificada')
         
-        return f"""
-        <style>
-            body {{ font-family: Arial; background: #f5f5f5; padding: 20px; }}
-            .container {{ max-width: 700px; margin: 0 auto; background: white; padding: 30px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-            .info-row {{ padding: 10px; border-bottom: 1px solid #eee; }}
-            .btn {{ background: #667eea; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px; display: inline-block; margin: 5px; }}
-            .success {{ color: green; font-weight: bold; }}
-        </style>
-        <div class='container'>
-            <h1>📍 Asignación de Laboratorio</h1>
-            <h3>{nombre_completo}</h3>
-            <div class='info-row'><strong>Cédula:</strong> {cedula}</div>
-            <div class='info-row'><strong>Email:</strong> {registro['correo']}</div>
-            <hr>
-            <h3>🏫 Información de Asignación:</h3>
-            <div class='info-row'><strong>Carrera:</strong> {carrera_nombre}</div>
-            <div class='info-row'><strong>Sede:</strong> Sede {asignacion['sede_id']} - Matriz Manta</div>
-            <div class='info-row'><strong>Edificio:</strong> {asignacion['edificio']}</div>
-            <div class='info-row'><strong>Laboratorio:</strong> {asignacion['laboratorio']}</div>
-            <hr>
-            <h3>📅 Fecha y Hora:</h3>
-            <div class='info-row'><strong>Fecha del Examen:</strong> {asignacion['fecha_examen']}</div>
-            <div class='info-row'><strong>Hora de Inicio:</strong> {asignacion['hora_inicio']}</div>
-            <div class='info-row'><strong>Estado:</strong> <span class='success'>{asignacion['estado']}</span></div>
-            <br>
-            <p><em>{mensaje_correo}</em></p>
-            <a href='/opcion7' class='btn'>← Nueva consulta</a>
-            <a href='/dashboard' class='btn'>← Volver al menú</a>
-        </div>
-        """
+        return render_template('asignacion_resultado.html',
+                             registro=registro,
+                             cedula=cedula,
+                             asignacion=asignacion,
+                             carrera_nombre=carrera_nombre,
+                             mensaje_correo=mensaje_correo)
     
     cedula_default = cedula_sesion if rol == 'ESTUDIANTE' else ''
-    readonly = "readonly" if rol == 'ESTUDIANTE' else ""
     
-    return f"""
-    <style>
-        body {{ font-family: Arial; background: #f5f5f5; padding: 20px; }}
-        .container {{ max-width: 600px; margin: 0 auto; background: white; padding: 30px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-        input[type='text'] {{ width: 100%; padding: 12px; margin: 10px 0; border: 1px solid #ddd; border-radius: 5px; box-sizing: border-box; }}
-        .btn {{ background: #667eea; color: white; padding: 12px 24px; border: none; border-radius: 5px; cursor: pointer; width: 100%; font-size: 16px; }}
-        .btn:hover {{ background: #5568d3; }}
-        .btn-secondary {{ background: #6c757d; margin-top: 10px; }}
-    </style>
-    <div class='container'>
-        <h1>📍 Consultar Asignación</h1>
-        <form method='POST'>
-            <label><strong>Ingrese cédula:</strong></label>
-            <input type='text' name='cedula' required pattern='[0-9]{{10}}' 
-                   placeholder='Ej: 1316202082' value='{cedula_default}' {readonly}>
-            <button type='submit' class='btn'>Consultar</button>
-        </form>
-        <br>
-        <a href='/dashboard' class='btn btn-secondary' style='text-decoration: none; display: block; text-align: center;'>← Volver al menú</a>
-    </div>
-    """
+    return _render_formulario('consulta_cedula.html',
+                              titulo='Consultar Asignación',
+                              icono='📍',
+                              boton='Consultar',
+                              cedula_default=cedula_default,
+                              solo_lectura=rol == 'ESTUDIANTE')
+
+# Registrar el blueprint una vez declaradas todas sus rutas
+app.register_blueprint(tramites)
 
 # ========== OPCIÓN 8: CONSULTAR PUNTAJE ==========
 
 @app.route('/opcion8')
 def opcion8():
     """Consultar puntaje final del postulante"""
-    if 'cedula' not in session:
-        return redirect(url_for('index'))
-    
-    cedula = session.get('cedula')
-    puntaje = db.obtener_puntaje_por_cedula(cedula)
+    cedula = g.user.cedula
+    # Registro y puntaje en una sola consulta (índices en memoria)
+    registro, puntaje = db.obtener_registro_con_puntaje(cedula)
     
     if not puntaje:
         flash('No se encontró puntaje registrado', 'warning')
-        return redirect(url_for('dashboard'))
-    
-    registro = db.obtener_registro_por_cedula(cedula)
-    nombre_completo = f"{registro['primer_nombre']} {registro['apellido_paterno']}"
+        return redirect(url_fija('dashboard'))
     
     porcentaje = puntaje['porcentaje']
     
-    if porcentaje >= 90:
-        calificacion_txt = "EXCELENTE"
-        color = "green"
-    elif porcentaje >= 80:
-        calificacion_txt = "MUY BUENO"
-        color = "green"
-    elif porcentaje >= 70:
-        calificacion_txt = "BUENO"
-        color = "green"
-    elif porcentaje >= 60:
-        calificacion_txt = "ACEPTABLE"
-        color = "orange"
-    else:
-        calificacion_txt = "INSUFICIENTE"
-        color = "red"
+    calificacion_txt, clase_estado = _NIVELES_PUNTAJE[bisect_right(_CORTES_PUNTAJE, porcentaje)]
     
-    return f"""
-    <style>
-        body {{ font-family: Arial; background: #f5f5f5; padding: 20px; }}
-        .container {{ max-width: 700px; margin: 0 auto; background: white; padding: 30px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-        .info-row {{ padding: 10px; border-bottom: 1px solid #eee; }}
-        .btn {{ background: #667eea; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px; display: inline-block; margin: 5px; }}
-    </style>
-    <div class='container'>
-        <h1>📊 Consultar Puntaje</h1>
-        <h3>{nombre_completo}</h3>
-        <div class='info-row'><strong>Cédula:</strong> {cedula}</div>
-        <hr>
-        <h3>📝 Desglose de Puntaje:</h3>
-        <div class='info-row'><strong>Nota Bachillerato:</strong> {puntaje['nota_bachillerato']}/10 (30%)</div>
-        <div class='info-row'><strong>Puntaje SENESCYT:</strong> {puntaje['puntaje_senescyt']}/1000 (60%)</div>
-        <div class='info-row'><strong>Bonificación Mérito:</strong> {puntaje['bonificacion_merito']} puntos (10%)</div>
-        <hr>
-        <h3>🎯 Resultado Final:</h3>
-        <div class='info-row'><strong>Puntaje Final:</strong> {puntaje['puntaje_final']:.2f}/1000</div>
-        <div class='info-row'><strong>Porcentaje:</strong> {porcentaje:.2f}%</div>
-        <div class='info-row'><strong>Calificación:</strong> {calificacion_txt}</div>
-        <div class='info-row'><strong>Estado:</strong> <span style='color: {color}; font-weight: bold;'>{puntaje['estado_aprobacion']}</span></div>
-        <br>
-        <a href='/dashboard' class='btn'>← Volver al menú</a>
-    </div>
-    """
+    return _render_condicional('puntaje_resultado.html',
+                               registro=registro,
+                               cedula=cedula,
+                               puntaje=puntaje,
+                               calificacion_txt=calificacion_txt,
+                               clase_estado=clase_estado)
 
 # ========== RUTAS TYPESCRIPT CON VALIDACIONES ==========
 
 @app.route('/index_ts')
 def index_ts():
     """Menú funciones tradicionales"""
-    if 'cedula' not in session:
-        flash('Debe iniciar sesión', 'warning')
-        return redirect(url_for('index'))
-    
-    return render_template('index_ts.html',
-                         cedula=session.get('cedula'),
-                         nombre=session.get('nombre'),
-                         rol=session.get('rol'),
-                         estado=session.get('estado'))
+    usuario = g.user
+    return _respuesta_condicional(_index_ts_html(usuario.nombre, usuario.rol, request.script_root))
 
 @app.route('/verificar_registro_ts', methods=['GET', 'POST'])
 def verificar_registro_ts():
     """Verificar Registro Nacional en Excel para TypeScript - Valida estado COMPLETO"""
-    if 'cedula' not in session:
-        flash('Debe iniciar sesión', 'warning')
-        return redirect(url_for('index'))
-    
-    rol = session.get('rol')
-    cedula_sesion = session.get('cedula')
+    usuario = g.user
+    rol, cedula_sesion = usuario.rol, usuario.cedula
     
     # Pre-llenar cédula si es ESTUDIANTE
     cedula_default = cedula_sesion if rol == 'ESTUDIANTE' else ''
@@ -991,19 +1100,19 @@ def verificar_registro_ts():
             flash('Solo puede verificar su propio registro', 'error')
             cedula = cedula_sesion
         
-        if not cedula or len(cedula) != 10:
+        if not _CEDULA_RE.fullmatch(cedula):
             flash('Cédula inválida. Debe tener 10 dígitos', 'error')
-            return redirect(url_for('verificar_registro_ts'))
+            return redirect(url_fija('verificar_registro_ts'))
         
         # BUSCAR EN BASE DE DATOS EXCEL
-        registro = db.obtener_registro_por_cedula(cedula)
+        registro = obtener_registro(cedula)
         
         if not registro:
             flash('❌ Cédula no encontrada en la base de datos. No puedes inscribirte.', 'error')
         else:
             # Actualizar estado en sesión
             if cedula == cedula_sesion:
-                session['estado'] = registro['estado']
+                session['estado'] = usuario.estado = registro['estado']
     
     return render_template('verificar_registro_ts.html',
                          cedula_default=cedula_default,
@@ -1011,22 +1120,16 @@ def verificar_registro_ts():
                          rol=rol)
 
 @app.route('/ver_postulantes_ts')
+@requiere_admin('Acceso denegado. Solo administradores')
 def ver_postulantes_ts():
     """Ver postulantes TypeScript - Solo ADMIN"""
-    if session.get('rol') != 'ADMIN':
-        flash('Acceso denegado. Solo administradores', 'error')
-        return redirect(url_for('dashboard'))
-    
     resultado = llamar_typescript('/api/postulantes', 'GET')
     return render_template('ver_postulantes_ts.html', postulantes=resultado.get('data', []))
 
 @app.route('/crear_postulante_ts', methods=['GET', 'POST'])
+@requiere_admin('Acceso denegado. Solo administradores')
 def crear_postulante_ts():
     """Crear postulante TypeScript - Solo ADMIN"""
-    if session.get('rol') != 'ADMIN':
-        flash('Acceso denegado. Solo administradores', 'error')
-        return redirect(url_for('dashboard'))
-    
     if request.method == 'POST':
         datos = {
             'cedula': request.form.get('cedula'),
@@ -1036,31 +1139,30 @@ def crear_postulante_ts():
             'fechaNacimiento': request.form.get('fecha_nacimiento')
         }
         
-        resultado = llamar_typescript('/api/postulantes', 'POST', datos)
+        if not _CEDULA_RE.fullmatch(datos['cedula'] or ''):
+            flash('Cédula inválida. Debe tener 10 dígitos', 'error')
+            return redirect(url_fija('crear_postulante_ts'))
         
-        if resultado.get('exito'):
-            flash('✅ Postulante creado en TypeScript', 'success')
-        else:
-            flash(f'❌ Error: {resultado.get("error")}', 'error')
+        # La redirección no depende de la respuesta: no se espera al servidor TypeScript
+        llamar_typescript_async('/api/postulantes', 'POST', datos)
+        flash('✅ Postulante enviado al servidor TypeScript', 'success')
         
-        return redirect(url_for('dashboard'))
+        return redirect(url_fija('dashboard'))
     
     return render_template('crear_postulante.html')
 
 @app.route('/crear_inscripcion_ts', methods=['GET', 'POST'])
 def crear_inscripcion_ts():
     """Crear inscripción TypeScript - SOLO si estado COMPLETO"""
-    if 'cedula' not in session:
-        return redirect(url_for('index'))
-    
-    cedula = session.get('cedula')
+    usuario = g.user
+    cedula = usuario.cedula
     
     # VALIDAR ESTADO
-    if session.get('rol') == 'ESTUDIANTE':
-        registro = db.obtener_registro_por_cedula(cedula)
+    if usuario.rol == 'ESTUDIANTE':
+        registro = registro_del_usuario()
         if registro['estado'] != 'COMPLETO':
             flash(f'❌ Estado: {registro["estado"]}. Debe ser COMPLETO para inscribirse.', 'error')
-            return redirect(url_for('dashboard'))
+            return redirect(url_fija('dashboard'))
     
     if request.method == 'POST':
         datos = {
@@ -1069,23 +1171,25 @@ def crear_inscripcion_ts():
             'periodo': request.form.get('periodo')
         }
         
+        # Cédula mal formada: no vale la pena la llamada al servidor TypeScript
+        if not _CEDULA_RE.fullmatch(datos['cedula'] or ''):
+            flash('Cédula inválida. Debe tener 10 dígitos', 'error')
+            return render_template('crear_inscripcion_ts.html')
+        
         resultado = llamar_typescript('/api/inscripciones', 'POST', datos)
         
         if resultado.get('exito'):
             flash('✅ Inscripción creada exitosamente', 'success')
-            return redirect(url_for('ver_postulantes_ts'))
+            return redirect(url_fija('ver_postulantes_ts'))
         else:
             flash(f'❌ Error: {resultado.get("error")}', 'error')
     
     return render_template('crear_inscripcion_ts.html')
 
 @app.route('/crear_registro_ts', methods=['GET', 'POST'])
+@requiere_admin('Acceso denegado. Solo administradores')
 def crear_registro_ts():
     """Crear registro TypeScript - Solo ADMIN"""
-    if session.get('rol') != 'ADMIN':
-        flash('Acceso denegado. Solo administradores', 'error')
-        return redirect(url_for('dashboard'))
-    
     if request.method == 'POST':
         datos = {
             'cedula': request.form.get('cedula'),
@@ -1098,11 +1202,15 @@ def crear_registro_ts():
             'genero': request.form.get('genero')
         }
         
+        if not _CEDULA_RE.fullmatch(datos['cedula'] or ''):
+            flash('Cédula inválida. Debe tener 10 dígitos', 'error')
+            return render_template('crear_registro_ts.html')
+        
         resultado = llamar_typescript('/api/postulantes', 'POST', datos)
         
         if resultado.get('exito'):
             flash('✅ Postulante registrado exitosamente', 'success')
-            return redirect(url_for('ver_postulantes_ts'))
+            return redirect(url_fija('ver_postulantes_ts'))
         else:
             flash(f'❌ Error: {resultado.get("error")}', 'error')
     
@@ -1110,53 +1218,45 @@ def crear_registro_ts():
 
 # ========== MANEJO DE ERRORES ==========
 
-@app.errorhandler(404)
-def not_found(error):
-    return """
+# Páginas de error fijas: no dependen de la petición
+# Respuestas de error armadas una sola vez al importar
+_HTML_404 = """
     <h1>404 - Página no encontrada</h1>
     <p>La página que buscas no existe.</p>
     <a href='/'>Volver al inicio</a>
-    """, 404
+    """
 
-@app.errorhandler(500)
-def internal_error(error):
-    return """
+_HTML_500 = """
     <h1>500 - Error interno del servidor</h1>
     <p>Ocurrió un error inesperado.</p>
     <a href='/'>Volver al inicio</a>
-    """, 500
+    """
+
+_CABECERAS_HTML = MappingProxyType({'Content-Type': 'text/html; charset=utf-8'})
+_RESPUESTA_404 = (_HTML_404, 404, _CABECERAS_HTML)
+_RESPUESTA_500 = (_HTML_500, 500, _CABECERAS_HTML)
+
+@app.errorhandler(404)
+def not_found(error):
+    return _RESPUESTA_404
+
+@app.errorhandler(500)
+def internal_error(error):
+    return _RESPUESTA_500
 
 @app.route('/test_typescript')
 def test_typescript():
     """Prueba la conexión con TypeScript"""
     try:
         resultado = llamar_typescript('/health', 'GET')
-        
-        if resultado.get('status') == 'OK':
-            return f"""
-            <h1 style='color: green;'>✅ CONEXIÓN EXITOSA</h1>
-            <p>Flask puede comunicarse con TypeScript</p>
-            <pre>{resultado}</pre>
-            <br>
-            <a href='/dashboard'>← Volver al dashboard</a>
-            """
-        else:
-            return f"""
-            <h1 style='color: orange;'>⚠️ RESPUESTA INESPERADA</h1>
-            <pre>{resultado}</pre>
-            """
+        return render_template('test_typescript.html', resultado=resultado)
     except Exception as e:
-        return f"""
-        <h1 style='color: red;'>❌ ERROR DE CONEXIÓN</h1>
-        <p>Flask NO puede conectarse con TypeScript</p>
-        <p>Error: {str(e)}</p>
-        <br>
-        <p>Verifica que el servidor TypeScript esté corriendo en puerto 3000</p>
-        """
+        return render_template('test_typescript.html', error=str(e))
 
 # ========== PUNTO DE ENTRADA ==========
 
 if __name__ == '__main__':
+    depurando = os.environ.get('FLASK_DEBUG') == '1'
     if not os.path.exists(app.config['EXCEL_PATH']):
         print("⚠️  ADVERTENCIA: No se encontró el archivo datos_admision.xlsx")
         print("Ejecute primero: python crear_excel_inicial.py")
@@ -1164,5 +1264,26 @@ if __name__ == '__main__':
         print("✅ Archivo Excel encontrado")
         print("🚀 Iniciando sistema...")
         print(f"📊 Base de datos: {app.config['EXCEL_PATH']}")
-    
-    app.run(debug=True, port=5000)
\ No newline at end of file
+        # Copia en memoria e índices listos antes de aceptar peticiones. Con el
+        # recargador de Werkzeug el proceso padre solo vigila archivos: precarga el hijo
+        if not depurando or os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+            db.precargar()
+    
+    host = os.environ.get('HOST', '0.0.0.0')
+    puerto = int(os.environ.get('PORT', 5000))
+    if depurando:
+        # Desarrollo: recarga automática y depurador de Werkzeug
+        app.run(debug=True, port=puerto)
+    elif os.environ.get('SERVIDOR') == 'gevent':
+        # Un greenlet por conexión; las esperas de SMTP y TypeScript ceden el turno
+        from gevent.pywsgi import WSGIServer
+        WSGIServer((host, puerto), app).serve_forever()
+    else:
+        try:
+            from waitress import serve
+        except ImportError:
+            print("⚠️  waitress no está instalado; usando el servidor de desarrollo con hilos")
+            app.run(port=puerto, threaded=True)
+        else:
+            serve(app, host=host, port=puerto,
+                  threads=int(os.environ.get('WAITRESS_THREADS', 8)))
\ No newline at end of file
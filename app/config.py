@@ -4,6 +4,8 @@ Incluye configuración de Flask-Mail para envío de correos
 """
 
 import os
+import tempfile
+from datetime import timedelta
 
 class Config:
     """Configuración base del sistema"""
@@ -11,6 +13,11 @@ class Config:
     # Configuración Flask
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'sistema_sipu_uleam_2025_clave_secreta'
     
+    # La sesión dura una jornada desde el login; la cookie solo se vuelve a
+    # firmar cuando la sesión cambia, no en cada petición
+    PERMANENT_SESSION_LIFETIME = timedelta(hours=int(os.environ.get('SESSION_HORAS', 8)))
+    SESSION_REFRESH_EACH_REQUEST = False
+    
     # Configuración Flask-Mail
     MAIL_SERVER = 'smtp.gmail.com'
     MAIL_PORT = 587
@@ -30,6 +37,22 @@ class Config:
     
     # Ruta del archivo Excel
     EXCEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'datos_admision.xlsx')
+    
+    # Carpeta para la caché de bytecode de plantillas Jinja
+    JINJA_CACHE_DIR = os.environ.get('JINJA_CACHE_DIR') or os.path.join(tempfile.gettempdir(), 'uleam_jinja_cache')
+    
+    # Recargar plantillas al editarlas (solo en desarrollo; evita un stat por render)
+    TEMPLATES_AUTO_RELOAD = os.environ.get('TEMPLATES_AUTO_RELOAD') == '1'
+    
+    # Compresión gzip de respuestas (bytes mínimos y nivel 1-9)
+    COMPRESS_MIN_SIZE = 512
+    COMPRESS_LEVEL = 6
+    
+    # Postulantes por página en el listado (opción 4)
+    POSTULANTES_POR_PAGINA = 50
+    
+    # Segundos que el navegador puede reutilizar los archivos de /static sin volver a pedirlos
+    SEND_FILE_MAX_AGE_DEFAULT = int(os.environ.get('STATIC_MAX_AGE', 86400))
 
 
 # ========== INSTRUCCIONES PARA CONFIGURAR GMAIL ==========
@@ -4,58 +4,836 @@ Maneja todas las operaciones CRUD sobre datos_admision.xlsx
 """
 
 from openpyxl import load_workbook
-from datetime import datetime
-from threading import Lock
+from contextlib import contextmanager
+from datetime import date
+from threading import Condition, Lock, Timer
+import atexit
+import os
+import pickle
+import tempfile
+import time
 from .validators import CedulaValidator, EmailValidator, CalificacionValidator
 
+# Lector nativo (Rust) opcional para la carga completa del Excel; sin él se usa openpyxl
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+
+def _hoy():
+    """Fecha de hoy como 'AAAA-MM-DD' (fecha_registro, fecha_inscripcion, ...)"""
+    return date.today().isoformat()
+
+
+class _CandadoLectorEscritor:
+    """
+    Candado lector/escritor con preferencia de escritura: varias consultas
+    leen la copia en memoria a la vez; una modificación espera a que terminen
+    y las lecturas nuevas esperan a que ella termine
+
+    `with candado:` toma el acceso exclusivo (como un Lock) y
+    `with candado.lectura():` el compartido. Ninguno es reentrante.
+    """
+
+    def __init__(self):
+        self._condicion = Condition(Lock())
+        self._lectores = 0
+        self._escribiendo = False
+        self._escritores_en_espera = 0
+
+    @contextmanager
+    def lectura(self):
+        """Acceso compartido mientras dure el bloque with"""
+        with self._condicion:
+            while self._escribiendo or self._escritores_en_espera:
+                self._condicion.wait()
+            self._lectores += 1
+        try:
+            yield
+        finally:
+            with self._condicion:
+                self._lectores -= 1
+                if not self._lectores:
+                    self._condicion.notify_all()
+
+    def __enter__(self):
+        with self._condicion:
+            self._escritores_en_espera += 1
+            while self._escribiendo or self._lectores:
+                self._condicion.wait()
+            self._escritores_en_espera -= 1
+            self._escribiendo = True
+        return self
+
+    def __exit__(self, *excepcion):
+        with self._condicion:
+            self._escribiendo = False
+            self._condicion.notify_all()
+        return False
+
 
 class ExcelManager:
     """
     Gestor principal de operaciones Excel
     Implementa CRUD completo con thread-safety
     """
+
+    # Segundos que el navegador puede reutilizar las páginas de sedes y carreras
+    # (en el servidor los catálogos duran lo que la hoja de la que salen)
+    CATALOGO_TTL = 300
+    # Segundos que se agrupan las modificaciones antes de escribirlas en disco
+    ESCRITURA_DIFERIDA = 2.0
+    # Espera máxima entre reintentos si la escritura falla (p. ej. el Excel
+    # está abierto en otro programa); cada fallo duplica la espera
+    REINTENTO_MAXIMO = 60.0
+    # Segundos entre comprobaciones de si el Excel cambió en disco (os.stat)
+    REVISION_DISCO = 1.0
     
     def __init__(self, excel_path="datos_admision.xlsx"):
         self.excel_path = excel_path
-        self.lock = Lock()  # Thread-safety para operaciones concurrentes
+        # Copia serializada de las hojas junto al Excel (arranques en frío rápidos)
+        self.snapshot_path = os.path.splitext(excel_path)[0] + ".snapshot.pickle"
+        # Exclusivo para cargar y modificar; compartido (lock.lectura()) para consultar
+        self.lock = _CandadoLectorEscritor()
         self.validators = {
             'cedula': CedulaValidator(),
             'email': EmailValidator(),
             'calificacion': CalificacionValidator()
         }
-    
+        # Copia en memoria de las hojas: {hoja: [filas]} (se carga bajo demanda)
+        self._hojas = None
+        # (mtime_ns, tamaño) del Excel cuando se cargó la copia en memoria
+        self._firma_hojas = None
+        # Instante (monotonic) de la última comprobación de la firma en disco
+        self._revision_hojas = 0.0
+        # Índice cédula -> fila de registros_nacionales
+        self._indice_registros = None
+        # Cédulas con rol ADMIN en la hoja administradores
+        self._cedulas_admin = None
+        # Índice cédula -> usuario para el login (se construye bajo demanda)
+        self._indice_usuarios = None
+        # Índices cédula -> fila de las hojas hijas: {hoja: {cedula: fila}} (bajo demanda)
+        self._indices_hijas = {}
+        # Registros ya convertidos a dict: {cedula: registro} (bajo demanda)
+        self._registros = {}
+        # Caché de catálogos (sedes, carreras): {clave: (filas de origen, datos)}
+        self._catalogos = {}
+        # Libro editable en memoria y estado de la escritura diferida
+        self._libro = None
+        self._firma_libro = None
+        self._pendiente = False
+        self._temporizador = None
+        # Escrituras fallidas seguidas (para espaciar los reintentos)
+        self._fallos_volcado = 0
+        # Modificaciones aplicadas al libro (para saber si cambió mientras se guardaba)
+        self._version_libro = 0
+        self._volcando = Lock()
+        atexit.register(self.volcar_cambios)
+
     # ========================================
     # MÉTODOS AUXILIARES
     # ========================================
     
-    def _obtener_siguiente_id(self, hoja_nombre):
+    def _abrir_lectura(self):
+        """
+        Abre el Excel en modo solo lectura (lectura en streaming, sin
+        construir el árbol completo de celdas en memoria)
+
+        Returns:
+            Workbook: Libro de solo lectura; cerrarlo siempre con wb.close()
+        """
+        wb = load_workbook(self.excel_path, read_only=True, data_only=True)
+        # En solo lectura openpyxl se detiene en el rango de <dimension>, que
+        # algunas herramientas guardan mal (p. ej. "A1"): se lee hasta el final
+        for ws in wb.worksheets:
+            ws.reset_dimensions()
+        return wb
+
+    def _firma_archivo(self):
+        """Devuelve (mtime_ns, tamaño) del Excel en disco"""
+        estado = os.stat(self.excel_path)
+        return (estado.st_mtime_ns, estado.st_size)
+
+    def _libro_escritura(self):
+        """
+        Devuelve el libro editable que se mantiene en memoria entre
+        modificaciones; se vuelve a cargar si el Excel cambió en disco y no
+        hay cambios propios pendientes (llamar con self.lock tomado)
+
+        Returns:
+            Workbook: Libro openpyxl en modo normal (no cerrarlo)
+        """
+        if self._libro is not None and not self._pendiente:
+            if self._firma_archivo() != self._firma_libro:
+                self._libro = None
+
+        if self._libro is None:
+            self._firma_libro = self._firma_archivo()
+            self._libro = load_workbook(self.excel_path)
+
+        return self._libro
+
+    def _guardar_libro(self, wb, *hojas_modificadas, cedula=None, fila=None):
+        """
+        Registra las modificaciones hechas sobre el libro editable: actualiza
+        la copia en memoria para que las consultas las vean de inmediato y
+        programa la escritura en disco (llamar con self.lock tomado)
+
+        Args:
+            wb: Libro devuelto por _libro_escritura()
+            *hojas_modificadas: Hojas que cambiaron; si la copia en memoria
+                corresponde a este libro solo se vuelven a leer esas
+            cedula: Si solo cambiaron filas de esta cédula, los índices se
+                ajustan para ella en lugar de reconstruirse
+            fila: Fila del libro (desde 2) insertada o actualizada para esa
+                cédula; None si sus filas se eliminaron
+        """
+        previas = self._hojas
+        sigue_libro = previas is not None and (
+            self._pendiente or self._firma_hojas == self._firma_libro)
+        if hojas_modificadas and sigue_libro:
+            hojas = dict(previas)
+            for nombre in hojas_modificadas:
+                hojas[nombre] = list(wb[nombre].iter_rows(min_row=2, values_only=True))
+        else:
+            hojas = {ws.title: list(ws.iter_rows(min_row=2, values_only=True))
+                     for ws in wb.worksheets}
+
+        self._pendiente = True
+        self._version_libro += 1
+        if hojas_modificadas and sigue_libro and cedula is not None:
+            self._hojas = hojas
+            self._ajustar_indices(hojas_modificadas, str(cedula), fila)
+        else:
+            self._invalidar_cache()
+            self._establecer_hojas(hojas, self._firma_hojas)
+
+        self._programar_volcado(self.ESCRITURA_DIFERIDA)
+
+    def _programar_volcado(self, segundos):
+        """
+        Programa volcar_cambios si no hay una escritura ya programada
+        (llamar con self.lock tomado)
+
+        Args:
+            segundos: Espera antes de escribir
+        """
+        if self._temporizador is None:
+            self._temporizador = Timer(segundos, self.volcar_cambios)
+            self._temporizador.daemon = True
+            self._temporizador.start()
+
+    def volcar_cambios(self):
+        """
+        Escribe en disco las modificaciones pendientes de forma atómica:
+        guarda en un temporal del mismo directorio y lo reemplaza, así un
+        lector nunca ve un archivo a medias. Se ejecuta tras ESCRITURA_DIFERIDA
+        segundos y al terminar el proceso; si falla se vuelve a programar con
+        una espera que se duplica en cada fallo (hasta REINTENTO_MAXIMO)
+
+        Returns:
+            bool: True si no quedan cambios pendientes
+        """
+        with self._volcando:  # Una escritura en disco a la vez
+            with self.lock:
+                self._temporizador = None
+                if not self._pendiente:
+                    return True
+
+            # Guardar no modifica el libro ni la copia en memoria: con acceso
+            # compartido las consultas de cualquier hoja siguen atendiéndose
+            # mientras se escribe y solo las modificaciones esperan
+            with self.lock.lectura():
+                version = self._version_libro
+                directorio = os.path.dirname(os.path.abspath(self.excel_path))
+                fd, temporal = tempfile.mkstemp(suffix=".xlsx", dir=directorio)
+                os.close(fd)
+                try:
+                    self._libro.save(temporal)
+                    os.replace(temporal, self.excel_path)
+                except Exception as e:
+                    print(f"Error al guardar el Excel: {e}")
+                    if os.path.exists(temporal):
+                        os.remove(temporal)
+                    firma = None
+                else:
+                    firma = self._firma_archivo()
+                    self._escribir_snapshot(firma, self._hojas)
+
+            with self.lock:
+                if firma is None:
+                    # Los cambios siguen pendientes: se reintenta más tarde
+                    self._fallos_volcado += 1
+                    self._programar_volcado(min(self.ESCRITURA_DIFERIDA * 2 ** self._fallos_volcado,
+                                                self.REINTENTO_MAXIMO))
+                    return False
+
+                self._fallos_volcado = 0
+                # Si hubo modificaciones después de guardar siguen pendientes
+                # (ya programaron su propia escritura)
+                if self._version_libro == version:
+                    self._firma_libro = firma
+                    self._firma_hojas = firma
+                    self._pendiente = False
+                return not self._pendiente
+    
+    def _obtener_siguiente_id(self, ws):
         """
         Obtiene el siguiente ID auto-incremental para una hoja
         
         Args:
-            hoja_nombre: Nombre de la hoja Excel
+            ws: Hoja del libro editable (con self.lock tomado), que ya
+                incluye las inserciones aún no escritas en disco
             
         Returns:
             int: Siguiente ID disponible
         """
-        with self.lock:
-            wb = load_workbook(self.excel_path)
-            ws = wb[hoja_nombre]
-            
-            max_id = 0
-            for row in ws.iter_rows(min_row=2, max_col=1, values_only=True):
-                if row[0] and isinstance(row[0], int):
-                    max_id = max(max_id, row[0])
-            
-            wb.close()
-            return max_id + 1
+        max_id = 0
+        for row in ws.iter_rows(min_row=2, max_col=1, values_only=True):
+            if row[0] and isinstance(row[0], int):
+                max_id = max(max_id, row[0])
+        return max_id + 1
     
     def _formatear_nombre(self, texto):
         """Formatea nombres a mayúsculas y sin espacios extra"""
         if not texto:
             return ""
         return " ".join(texto.upper().strip().split())
-    
+
+    # ========================================
+    # COPIA EN MEMORIA DEL EXCEL
+    # ========================================
+
+    def _cargar_hojas(self):
+        """
+        Lee todas las hojas en una sola pasada y deja sus filas en memoria,
+        junto con el índice por cédula de registros_nacionales y el
+        conjunto de cédulas de administradores (llamar con self.lock tomado)
+
+        Si el archivo cambió en disco desde la última carga (p. ej. se editó
+        en Excel a mano) se descarta la copia y se vuelve a leer; el cambio
+        se detecta con hasta REVISION_DISCO segundos de retraso
+
+        Returns:
+            dict: {hoja: [tuplas de valores sin encabezado]}
+        """
+        if self._pendiente:
+            return self._hojas  # La copia en memoria va por delante del disco
+
+        # Una consulta llama varias veces a _filas: el stat se hace a lo sumo
+        # una vez cada REVISION_DISCO segundos
+        ahora = time.monotonic()
+        if self._hojas is not None and ahora - self._revision_hojas < self.REVISION_DISCO:
+            return self._hojas
+        self._revision_hojas = ahora
+
+        firma = self._firma_archivo()
+
+        if self._hojas is not None and firma != self._firma_hojas:
+            self._invalidar_cache()
+            self._catalogos.clear()
+
+        if self._hojas is None:
+            hojas = self._leer_snapshot(firma)
+            if hojas is None:
+                hojas = self._leer_excel()
+                self._escribir_snapshot(firma, hojas)
+
+            self._establecer_hojas(hojas, firma)
+
+        return self._hojas
+
+    def _leer_excel(self):
+        """
+        Lee todas las hojas del Excel en disco; con python-calamine instalado
+        el XML se parsea en código nativo, si no con openpyxl en solo lectura
+
+        Returns:
+            dict: {hoja: [tuplas de valores sin encabezado]}
+        """
+        if CalamineWorkbook is not None:
+            wb = CalamineWorkbook.from_path(self.excel_path)
+            return {
+                nombre: [tuple(map(self._celda_calamine, fila))
+                         for fila in wb.get_sheet_by_name(nombre).to_python()[1:]]
+                for nombre in wb.sheet_names
+            }
+
+        wb = self._abrir_lectura()
+        try:
+            return {ws.title: self._filas_rectangulares(ws) for ws in wb.worksheets}
+        finally:
+            wb.close()
+
+    @staticmethod
+    def _filas_rectangulares(ws):
+        """
+        Filas de datos de una hoja abierta con reset_dimensions(); sin el rango
+        declarado las filas incompletas o vacías vienen más cortas, así que se
+        completan con None hasta el ancho del encabezado
+
+        Args:
+            ws: Hoja de un libro de solo lectura
+
+        Returns:
+            list: Tuplas de valores sin encabezado
+        """
+        filas = ws.iter_rows(values_only=True)
+        ancho = len(next(filas, ()))
+        return [fila if len(fila) >= ancho else tuple(fila) + (None,) * (ancho - len(fila))
+                for fila in filas]
+
+    @staticmethod
+    def _celda_calamine(valor):
+        """
+        Ajusta un valor de calamine a lo que devuelve openpyxl: celdas
+        vacías como None y números enteros como int (IDs, cédulas)
+        """
+        if valor == "":
+            return None
+        if isinstance(valor, float) and valor.is_integer():
+            return int(valor)
+        return valor
+
+    def _establecer_hojas(self, hojas, firma):
+        """
+        Instala una copia en memoria de las hojas y reconstruye sus índices
+        (llamar con self.lock tomado)
+
+        Args:
+            hojas: {hoja: [filas]}
+            firma: (mtime_ns, tamaño) del Excel al que corresponden
+        """
+        self._indice_registros = {
+            str(row[0]): row for row in hojas["registros_nacionales"] if row[0]
+        }
+        self._cedulas_admin = frozenset(
+            str(row[0]) for row in hojas["administradores"] if row[0] and row[2] == "ADMIN"
+        )
+        self._indices_hijas = {}
+        self._registros = {}
+        self._hojas = hojas
+        self._firma_hojas = firma
+
+    def _leer_snapshot(self, firma):
+        """
+        Lee la copia serializada de las hojas si corresponde al Excel actual
+
+        Args:
+            firma: (mtime_ns, tamaño) del Excel
+
+        Returns:
+            dict: Hojas guardadas o None si no hay copia o está desactualizada
+        """
+        try:
+            with open(self.snapshot_path, "rb") as archivo:
+                guardado = pickle.load(archivo)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+        if guardado.get("firma") != firma:
+            return None
+        return guardado.get("hojas")
+
+    def _escribir_snapshot(self, firma, hojas):
+        """
+        Guarda la copia serializada de las hojas (escritura atómica);
+        si falla solo se pierde la optimización
+
+        Args:
+            firma: (mtime_ns, tamaño) del Excel leído
+            hojas: {hoja: [filas]}
+        """
+        directorio = os.path.dirname(os.path.abspath(self.snapshot_path))
+        temporal = None
+        try:
+            fd, temporal = tempfile.mkstemp(suffix=".pickle", dir=directorio)
+            with os.fdopen(fd, "wb") as archivo:
+                pickle.dump({"firma": firma, "hojas": hojas}, archivo, pickle.HIGHEST_PROTOCOL)
+            os.replace(temporal, self.snapshot_path)
+        except Exception as e:
+            print(f"No se pudo guardar la copia serializada: {e}")
+            if temporal and os.path.exists(temporal):
+                os.remove(temporal)
+
+    def _filas(self, hoja_nombre):
+        """
+        Filas en memoria de una hoja; no recarga (llamar dentro de _lectura()
+        o con self.lock tomado después de _cargar_hojas)
+        """
+        if self._hojas is None:
+            raise RuntimeError("No se pudo cargar el Excel")
+        return self._hojas[hoja_nombre]
+
+    @contextmanager
+    def _lectura(self):
+        """
+        Sección de consulta: si la copia en memoria puede estar desactualizada
+        se revisa/recarga con acceso exclusivo y luego se lee con acceso
+        compartido, durante el cual nadie la reemplaza
+        """
+        if self._hojas is None or (
+                not self._pendiente
+                and time.monotonic() - self._revision_hojas >= self.REVISION_DISCO):
+            with self.lock:
+                try:
+                    self._cargar_hojas()
+                except Exception as e:
+                    print(f"Error al cargar el Excel: {e}")  # _filas lo vuelve a señalar
+        with self.lock.lectura():
+            yield
+
+    def _ajustar_indices(self, hojas_modificadas, cedula, fila):
+        """
+        Ajusta los índices en memoria tras un cambio que solo afecta a una
+        cédula, sin recorrer las hojas (llamar con self.lock tomado y la copia
+        en memoria ya actualizada)
+
+        Args:
+            hojas_modificadas: Hojas en las que cambió la cédula
+            cedula: Cédula afectada (str)
+            fila: Fila del libro (desde 2) con sus datos nuevos, o None si
+                se eliminaron sus filas
+        """
+        for nombre in hojas_modificadas:
+            nueva = self._hojas[nombre][fila - 2] if fila else None
+            if nombre == "registros_nacionales":
+                if nueva:
+                    self._indice_registros[cedula] = nueva
+                else:
+                    self._indice_registros.pop(cedula, None)
+                self._registros.pop(cedula, None)
+                # Los administradores tienen prioridad en el índice de login
+                if self._indice_usuarios is not None and cedula not in self._cedulas_admin:
+                    if nueva:
+                        self._indice_usuarios[cedula] = self._usuario_estudiante(nueva)
+                    else:
+                        self._indice_usuarios.pop(cedula, None)
+            else:
+                indice = self._indices_hijas.get(nombre)
+                if indice is not None:
+                    if nueva:
+                        indice.setdefault(cedula, nueva)  # Se conserva la primera fila
+                    else:
+                        indice.pop(cedula, None)
+
+    def _invalidar_cache(self):
+        """Descarta la copia en memoria y sus índices (llamar con self.lock tomado)"""
+        self._hojas = None
+        self._indice_registros = None
+        self._cedulas_admin = None
+        self._indice_usuarios = None
+        self._indices_hijas = {}
+        self._registros = {}
+
+    def precargar(self):
+        """
+        Carga las hojas y arma todos los índices por cédula de una vez
+
+        Pensado para el arranque: así la primera petición no paga el parseo
+        del Excel ni la construcción de índices.
+
+        Returns:
+            bool: True si la carga fue exitosa
+        """
+        with self.lock:
+            try:
+                self._cargar_hojas()
+                for hoja in ("inscripciones", "evaluaciones", "asignaciones", "puntajes"):
+                    self._buscar_hija(hoja, "", lambda row: row)
+                return True
+            except Exception as e:
+                print(f"Error al precargar el Excel: {e}")
+                return False
+
+    # ========================================
+    # ÍNDICE DE USUARIOS (LOGIN)
+    # ========================================
+
+    def _construir_indice_usuarios(self):
+        """
+        Recorre una sola vez las hojas de registros y administradores
+        y arma el índice cédula -> datos de sesión (llamar con self.lock tomado)
+
+        Returns:
+            dict: {cedula: {'rol', 'nombre', 'email', 'estado'}}
+        """
+        indice = {}
+        for row in self._filas("registros_nacionales"):
+            if row[0]:
+                indice[str(row[0])] = self._usuario_estudiante(row)
+
+        # Los administradores tienen prioridad sobre los estudiantes
+        for row in self._filas("administradores"):
+            if row[0] and row[2] == "ADMIN":
+                indice[str(row[0])] = {
+                    'rol': 'ADMIN',
+                    'nombre': row[1],
+                    'email': row[3],
+                    'estado': None
+                }
+
+        return indice
+
+    @staticmethod
+    def _usuario_estudiante(row):
+        """Datos de sesión de un estudiante a partir de su fila de registros_nacionales"""
+        return {
+            'rol': 'ESTUDIANTE',
+            'nombre': f"{row[1] or ''} {row[3] or ''}",
+            'email': row[5] or '',
+            'estado': row[9] or 'PENDIENTE'
+        }
+
+    def obtener_usuario(self, cedula):
+        """
+        Obtiene los datos de sesión de un usuario (admin o estudiante)
+
+        Args:
+            cedula: Número de cédula
+
+        Returns:
+            dict: {'rol', 'nombre', 'email', 'estado'} o None si no existe
+        """
+        with self._lectura():
+            try:
+                self._filas("registros_nacionales")  # Falla si no se pudo cargar
+                if self._indice_usuarios is None:
+                    self._indice_usuarios = self._construir_indice_usuarios()
+            except Exception as e:
+                print(f"Error al construir índice de usuarios: {e}")
+                return None
+
+            return self._indice_usuarios.get(str(cedula))
+
+    # ========================================
+    # CACHÉ DE CATÁLOGOS (SEDES / CARRERAS / REGISTROS)
+    # ========================================
+
+    def _catalogo_en_cache(self, clave, hoja_nombre):
+        """
+        Devuelve el catálogo cacheado si la hoja de la que salió no cambió
+        (llamar dentro de _lectura()). Cada recarga o modificación de una hoja
+        instala una lista de filas nueva, así que basta comparar identidades
+
+        Args:
+            clave: Nombre del catálogo
+            hoja_nombre: Hoja Excel de la que se construye
+
+        Returns:
+            list: Datos cacheados o None si no hay o la hoja cambió
+        """
+        entrada = self._catalogos.get(clave)
+        if entrada and self._hojas is not None and entrada[0] is self._hojas.get(hoja_nombre):
+            return entrada[1]
+        return None
+
+    def _guardar_catalogo(self, clave, filas, datos):
+        """
+        Guarda un catálogo en caché junto con la lista de filas de la que se
+        construyó (llamar dentro de _lectura() o con self.lock tomado)
+        """
+        self._catalogos[clave] = (filas, datos)
+
+    def invalidar_catalogos(self):
+        """Descarta sedes y carreras cacheadas (usar tras modificarlas)"""
+        with self.lock:
+            self._catalogos.clear()
+
+    # ========================================
+    # CONVERSIÓN DE FILAS A DICCIONARIOS
+    # ========================================
+
+    @staticmethod
+    def _fila_a_registro(row):
+        """Convierte una fila de registros_nacionales en diccionario"""
+        return {
+            'cedula': str(row[0]),
+            'primer_nombre': row[1] or '',
+            'segundo_nombre': row[2] or '',
+            'apellido_paterno': row[3] or '',
+            'apellido_materno': row[4] or '',
+            'correo': row[5] or '',
+            'celular': str(row[6]) if row[6] else '',
+            'calificacion': float(row[7]) if row[7] else 0.0,
+            'cuadro_honor': row[8] or 'NO',
+            'estado': row[9] or 'PENDIENTE',
+            'fecha_registro': row[10]
+        }
+
+    @staticmethod
+    def _fila_a_evaluacion(row):
+        """Convierte una fila de evaluaciones en diccionario"""
+        return {
+            'id_evaluacion': row[0],
+            'cedula_postulante': str(row[1]),
+            'nota_verbal': float(row[2]) if row[2] else 0.0,
+            'nota_numerica': float(row[3]) if row[3] else 0.0,
+            'nota_abstracta': float(row[4]) if row[4] else 0.0,
+            'puntaje_total': float(row[5]) if row[5] else 0.0,
+            'estado': row[6],
+            'fecha_evaluacion': row[7]
+        }
+
+    @staticmethod
+    def _fila_a_asignacion(row):
+        """Convierte una fila de asignaciones en diccionario"""
+        return {
+            'id_asignacion': row[0],
+            'cedula_postulante': str(row[1]),
+            'carrera_id': row[2],
+            'sede_id': row[3],
+            'laboratorio': row[4],
+            'edificio': row[5],
+            'fecha_examen': row[6],
+            'hora_inicio': str(row[7]) if row[7] else '',
+            'estado': row[8]
+        }
+
+    @staticmethod
+    def _fila_a_inscripcion(row):
+        """Convierte una fila de inscripciones en diccionario"""
+        return {
+            'id_inscripcion': row[0],
+            'cedula_postulante': str(row[1]),
+            'carrera_id': row[2],
+            'carrera_nombre': row[3],
+            'jornada': row[4],
+            'estado': row[5],
+            'fecha_inscripcion': row[6]
+        }
+
+    @staticmethod
+    def _fila_a_puntaje(row):
+        """Convierte una fila de puntajes en diccionario"""
+        return {
+            'id_puntaje': row[0],
+            'cedula_postulante': str(row[1]),
+            'nota_bachillerato': float(row[2]) if row[2] else 0.0,
+            'puntaje_senescyt': int(row[3]) if row[3] else 0,
+            'bonificacion_merito': int(row[4]) if row[4] else 0,
+            'puntaje_final': float(row[5]) if row[5] else 0.0,
+            'porcentaje': float(row[6]) if row[6] else 0.0,
+            'estado_aprobacion': row[7]
+        }
+
+    def _buscar_hija(self, hoja_nombre, cedula, convertir):
+        """
+        Busca la primera fila de una hoja hija (cédula en la columna 2)
+
+        Se llama dentro de _lectura(). La primera consulta a cada hoja arma un
+        índice cédula -> fila; las siguientes son O(1) hasta el próximo cambio.
+        El índice se publica ya completo, así que dos lectores simultáneos a lo
+        sumo lo arman dos veces.
+
+        Args:
+            hoja_nombre: Nombre de la hoja (evaluaciones, asignaciones, ...)
+            cedula: Cédula del postulante
+            convertir: Función que convierte la fila en diccionario
+
+        Returns:
+            dict: Fila convertida o None si no existe
+        """
+        filas = self._filas(hoja_nombre)
+        indice = self._indices_hijas.get(hoja_nombre)
+        if indice is None:
+            indice = {}
+            for row in filas:
+                indice.setdefault(str(row[1]), row)
+            self._indices_hijas[hoja_nombre] = indice
+
+        row = indice.get(str(cedula))
+        return convertir(row) if row else None
+
+    # ========================================
+    # CONSULTAS COMBINADAS (REGISTRO + HOJA HIJA)
+    # ========================================
+
+    def _registro_en_memoria(self, cedula):
+        """
+        Registro de una cédula como dict, convertido una sola vez mientras no
+        cambie la copia en memoria (llamar dentro de _lectura()); el dict es
+        compartido y no debe modificarse
+
+        Args:
+            cedula: Número de cédula (str)
+
+        Returns:
+            dict: Datos del registro o None si no existe
+        """
+        registro = self._registros.get(cedula)
+        if registro is None:
+            row = self._indice_registros.get(cedula)
+            if not row:
+                return None
+            registro = self._registros[cedula] = self._fila_a_registro(row)
+        return registro
+
+    def _registro_con_hija(self, cedula, hoja_nombre, convertir):
+        """
+        Obtiene el registro nacional y su fila en una hoja hija con una sola carga
+
+        Args:
+            cedula: Número de cédula
+            hoja_nombre: Hoja hija a consultar
+            convertir: Función que convierte la fila hija en diccionario
+
+        Returns:
+            tuple: (registro, hija); registro es None si la cédula no existe
+                   y hija es None si no tiene fila en la hoja
+        """
+        es_valida, mensaje = self.validators['cedula'].validar(cedula)
+        if not es_valida:
+            return None, None
+
+        with self._lectura():
+            try:
+                self._filas("registros_nacionales")  # Falla si no se pudo cargar
+                registro = self._registro_en_memoria(str(cedula))
+                if registro is None:
+                    return None, None
+                return registro, self._buscar_hija(hoja_nombre, cedula, convertir)
+            except Exception as e:
+                print(f"Error al obtener {hoja_nombre}: {e}")
+                return None, None
+
+    def obtener_registro_con_evaluacion(self, cedula):
+        """
+        Obtiene el registro y la evaluación de un postulante en una sola consulta
+
+        Args:
+            cedula: Número de cédula
+
+        Returns:
+            tuple: (registro, evaluacion)
+        """
+        return self._registro_con_hija(cedula, "evaluaciones", self._fila_a_evaluacion)
+
+    def obtener_registro_con_asignacion(self, cedula):
+        """
+        Obtiene el registro y la asignación de un postulante en una sola consulta
+
+        Args:
+            cedula: Número de cédula
+
+        Returns:
+            tuple: (registro, asignacion)
+        """
+        return self._registro_con_hija(cedula, "asignaciones", self._fila_a_asignacion)
+
+    def obtener_registro_con_puntaje(self, cedula):
+        """
+        Obtiene el registro y el puntaje de un postulante en una sola consulta
+
+        Args:
+            cedula: Número de cédula
+
+        Returns:
+            tuple: (registro, puntaje)
+        """
+        return self._registro_con_hija(cedula, "puntajes", self._fila_a_puntaje)
+
     # ========================================
     # REGISTROS NACIONALES - CONSULTAS
     # ========================================
@@ -63,6 +841,7 @@ class ExcelManager:
     def obtener_registro_por_cedula(self, cedula):
         """
         Obtiene un registro completo por cédula
+        El dict se reutiliza entre consultas; no modificarlo
         
         Args:
             cedula: Número de cédula (10 dígitos)
@@ -75,31 +854,10 @@ class ExcelManager:
         if not es_valida:
             return None
         
-        with self.lock:
+        with self._lectura():
             try:
-                wb = load_workbook(self.excel_path)
-                ws = wb["registros_nacionales"]
-                
-                for row in ws.iter_rows(min_row=2, values_only=True):
-                    if str(row[0]) == str(cedula):
-                        registro = {
-                            'cedula': str(row[0]),
-                            'primer_nombre': row[1] or '',
-                            'segundo_nombre': row[2] or '',
-                            'apellido_paterno': row[3] or '',
-                            'apellido_materno': row[4] or '',
-                            'correo': row[5] or '',
-                            'celular': str(row[6]) if row[6] else '',
-                            'calificacion': float(row[7]) if row[7] else 0.0,
-                            'cuadro_honor': row[8] or 'NO',
-                            'estado': row[9] or 'PENDIENTE',
-                            'fecha_registro': row[10]
-                        }
-                        wb.close()
-                        return registro
-                
-                wb.close()
-                return None
+                self._filas("registros_nacionales")  # Falla si no se pudo cargar
+                return self._registro_en_memoria(str(cedula))
             except Exception as e:
                 print(f"Error al obtener registro: {e}")
                 return None
@@ -114,7 +872,17 @@ class ExcelManager:
         Returns:
             bool: True si existe, False si no
         """
-        return self.obtener_registro_por_cedula(cedula) is not None
+        es_valida, mensaje = self.validators['cedula'].validar(cedula)
+        if not es_valida:
+            return False
+
+        with self._lectura():
+            try:
+                self._filas("registros_nacionales")  # Falla si no se pudo cargar
+                return str(cedula) in self._indice_registros
+            except Exception as e:
+                print(f"Error al verificar registro: {e}")
+                return False
     
     def listar_todos_registros(self):
         """
@@ -123,34 +891,33 @@ class ExcelManager:
         Returns:
             list: Lista de diccionarios con todos los registros
         """
-        with self.lock:
+        return self.listar_registros()[0]
+    
+    def listar_registros(self, offset=0, limite=None):
+        """
+        Obtiene una página de registros. La hoja se convierte a dicts una sola
+        vez y se reutiliza como los catálogos hasta que la hoja cambie; los
+        dicts son compartidos y no deben modificarse
+        
+        Args:
+            offset: Cantidad de registros a saltar
+            limite: Máximo de registros a devolver (None = todos)
+            
+        Returns:
+            tuple: (lista de registros de la página, total de registros)
+        """
+        with self._lectura():
             try:
-                wb = load_workbook(self.excel_path)
-                ws = wb["registros_nacionales"]
-                
-                registros = []
-                for row in ws.iter_rows(min_row=2, values_only=True):
-                    if row[0]:  # Si tiene cédula
-                        registro = {
-                            'cedula': str(row[0]),
-                            'primer_nombre': row[1] or '',
-                            'segundo_nombre': row[2] or '',
-                            'apellido_paterno': row[3] or '',
-                            'apellido_materno': row[4] or '',
-                            'correo': row[5] or '',
-                            'celular': str(row[6]) if row[6] else '',
-                            'calificacion': float(row[7]) if row[7] else 0.0,
-                            'cuadro_honor': row[8] or 'NO',
-                            'estado': row[9] or 'PENDIENTE',
-                            'fecha_registro': row[10]
-                        }
-                        registros.append(registro)
-                
-                wb.close()
-                return registros
+                registros = self._catalogo_en_cache("registros", "registros_nacionales")
+                if registros is None:
+                    filas = self._filas("registros_nacionales")
+                    registros = [self._fila_a_registro(row) for row in filas if row[0]]  # Si tiene cédula
+                    self._guardar_catalogo("registros", filas, registros)
+                fin = None if limite is None else offset + limite
+                return registros[offset:fin], len(registros)
             except Exception as e:
                 print(f"Error al listar registros: {e}")
-                return []
+                return [], 0
     
     # ========================================
     # REGISTROS NACIONALES - CRUD
@@ -187,7 +954,7 @@ class ExcelManager:
         
         with self.lock:
             try:
-                wb = load_workbook(self.excel_path)
+                wb = self._libro_escritura()
                 ws = wb["registros_nacionales"]
                 
                 # Formatear datos
@@ -202,12 +969,12 @@ class ExcelManager:
                     float(datos.get('calificacion', 0)),
                     datos.get('cuadro_honor', 'NO').upper(),
                     datos.get('estado', 'PENDIENTE').upper(),
-                    datetime.now().strftime("%Y-%m-%d")
+                    _hoy()
                 ]
                 
                 ws.append(nueva_fila)
-                wb.save(self.excel_path)
-                wb.close()
+                self._guardar_libro(wb, "registros_nacionales",
+                                    cedula=datos['cedula'], fila=ws.max_row)
                 
                 return True, "Registro insertado exitosamente"
             except Exception as e:
@@ -239,39 +1006,43 @@ class ExcelManager:
             if not es_valida:
                 return False, mensaje
         
+        # Columna y conversión de cada campo actualizable; los valores se
+        # preparan antes de tomar el candado
+        columnas = {
+            'primer_nombre': (2, self._formatear_nombre),
+            'segundo_nombre': (3, self._formatear_nombre),
+            'apellido_paterno': (4, self._formatear_nombre),
+            'apellido_materno': (5, self._formatear_nombre),
+            'correo': (6, lambda valor: valor.lower().strip()),
+            'celular': (7, str),
+            'calificacion': (8, float),
+            'cuadro_honor': (9, str.upper),
+            'estado': (10, str.upper),
+        }
+        try:
+            cambios = [(columna, convertir(datos[campo]))
+                       for campo, (columna, convertir) in columnas.items() if campo in datos]
+        except Exception as e:
+            return False, f"Error al actualizar: {str(e)}"
+        
+        cedula = str(cedula)  # Se convierte una vez, no en cada fila
         with self.lock:
             try:
-                wb = load_workbook(self.excel_path)
+                wb = self._libro_escritura()
                 ws = wb["registros_nacionales"]
                 
-                # Buscar y actualizar
-                for row_idx, row in enumerate(ws.iter_rows(min_row=2), start=2):
-                    if str(row[0].value) == str(cedula):
-                        # Actualizar solo campos proporcionados
-                        if 'primer_nombre' in datos:
-                            ws.cell(row_idx, 2, self._formatear_nombre(datos['primer_nombre']))
-                        if 'segundo_nombre' in datos:
-                            ws.cell(row_idx, 3, self._formatear_nombre(datos['segundo_nombre']))
-                        if 'apellido_paterno' in datos:
-                            ws.cell(row_idx, 4, self._formatear_nombre(datos['apellido_paterno']))
-                        if 'apellido_materno' in datos:
-                            ws.cell(row_idx, 5, self._formatear_nombre(datos['apellido_materno']))
-                        if 'correo' in datos:
-                            ws.cell(row_idx, 6, datos['correo'].lower().strip())
-                        if 'celular' in datos:
-                            ws.cell(row_idx, 7, str(datos['celular']))
-                        if 'calificacion' in datos:
-                            ws.cell(row_idx, 8, float(datos['calificacion']))
-                        if 'cuadro_honor' in datos:
-                            ws.cell(row_idx, 9, datos['cuadro_honor'].upper())
-                        if 'estado' in datos:
-                            ws.cell(row_idx, 10, datos['estado'].upper())
+                # Buscar y actualizar (solo hace falta leer la columna de cédulas)
+                for row_idx, (valor,) in enumerate(
+                        ws.iter_rows(min_row=2, max_col=1, values_only=True), start=2):
+                    if str(valor) == cedula:
+                        # Solo se escriben las celdas de los campos proporcionados
+                        for columna, nuevo in cambios:
+                            ws.cell(row_idx, columna).value = nuevo
                         
-                        wb.save(self.excel_path)
-                        wb.close()
+                        self._guardar_libro(wb, "registros_nacionales",
+                                            cedula=cedula, fila=row_idx)
                         return True, "Registro actualizado exitosamente"
                 
-                wb.close()
                 return False, "Error al actualizar registro"
             except Exception as e:
                 return False, f"Error al actualizar: {str(e)}"
@@ -289,14 +1060,16 @@ class ExcelManager:
         if not self.existe_registro(cedula):
             return False, "Registro no encontrado"
         
+        cedula = str(cedula)  # Se convierte una vez, no en cada fila
         with self.lock:
             try:
-                wb = load_workbook(self.excel_path)
+                wb = self._libro_escritura()
                 
                 # Eliminar de registros_nacionales
                 ws_reg = wb["registros_nacionales"]
-                for row_idx, row in enumerate(ws_reg.iter_rows(min_row=2), start=2):
-                    if str(row[0].value) == str(cedula):
+                for row_idx, (valor,) in enumerate(
+                        ws_reg.iter_rows(min_row=2, max_col=1, values_only=True), start=2):
+                    if str(valor) == cedula:
                         ws_reg.delete_rows(row_idx, 1)
                         break
                 
@@ -312,26 +1085,82 @@ class ExcelManager:
                 # Eliminar puntajes relacionados
                 self._eliminar_relacionados(wb, "puntajes", cedula)
                 
-                wb.save(self.excel_path)
-                wb.close()
+                self._guardar_libro(wb, "registros_nacionales", "inscripciones",
+                                    "evaluaciones", "asignaciones", "puntajes",
+                                    cedula=cedula)
                 
                 return True, "Registro y dependencias eliminados exitosamente"
             except Exception as e:
                 return False, f"Error al eliminar: {str(e)}"
     
     def _eliminar_relacionados(self, workbook, hoja_nombre, cedula):
-        """Elimina registros relacionados de una hoja"""
+        """
+        Elimina registros relacionados de una hoja en una sola pasada: las
+        filas que quedan se suben sobre las eliminadas y al final se borra la
+        cola, en lugar de un delete_rows (que desplaza toda la hoja) por fila
+        """
         ws = workbook[hoja_nombre]
-        rows_to_delete = []
+        cedula = str(cedula)
+        
+        # Primero se busca solo en la columna de cédulas (columna 2); las filas
+        # completas se leen únicamente desde la primera coincidencia
+        for destino, (valor,) in enumerate(
+                ws.iter_rows(min_row=2, min_col=2, max_col=2, values_only=True), start=2):
+            if str(valor) == cedula:
+                break
+        else:
+            return
         
-        for row_idx, row in enumerate(ws.iter_rows(min_row=2), start=2):
-            # La cédula está en la columna 2 (índice 1)
-            if str(row[1].value) == str(cedula):
-                rows_to_delete.append(row_idx)
+        for row_idx, valores in enumerate(
+                ws.iter_rows(min_row=destino, values_only=True), start=destino):
+            if str(valores[1]) == cedula:
+                continue
+            if row_idx != destino:
+                # Asignando .value también se vacían las celdas en blanco
+                # (ws.cell(f, c, None) dejaría el valor de la fila eliminada)
+                for col_idx, valor in enumerate(valores, start=1):
+                    ws.cell(destino, col_idx).value = valor
+            destino += 1
         
-        # Eliminar en orden inverso para no afectar índices
-        for row_idx in reversed(rows_to_delete):
-            ws.delete_rows(row_idx, 1)
+        if destino <= ws.max_row:
+            ws.delete_rows(destino, ws.max_row - destino + 1)
+    
+    def _insertar_en_hoja(self, hoja_nombre, datos, construir_fila, mensaje_exito, descripcion):
+        """
+        Inserta una fila en una hoja hija tomando el candado una sola vez: la
+        existencia del registro, el siguiente ID y la inserción se resuelven
+        juntos, sin que otra modificación (p. ej. eliminar el registro) se
+        intercale entre la comprobación y la escritura
+
+        Args:
+            hoja_nombre: Hoja hija (inscripciones, evaluaciones, ...)
+            datos: Diccionario con 'cedula_postulante' y los campos de la fila
+            construir_fila: Función sin argumentos que devuelve la fila sin el ID
+            mensaje_exito: Mensaje a devolver si se insertó
+            descripcion: Nombre de la entidad para el mensaje de error
+
+        Returns:
+            tuple: (bool éxito, str mensaje)
+        """
+        cedula = datos['cedula_postulante']
+        es_valida, mensaje = self.validators['cedula'].validar(cedula)
+        if not es_valida:
+            return False, "No existe registro nacional para esta cédula"
+
+        with self.lock:
+            try:
+                self._cargar_hojas()
+                if str(cedula) not in self._indice_registros:
+                    return False, "No existe registro nacional para esta cédula"
+
+                wb = self._libro_escritura()
+                ws = wb[hoja_nombre]
+                ws.append([self._obtener_siguiente_id(ws)] + construir_fila())
+                self._guardar_libro(wb, hoja_nombre, cedula=cedula, fila=ws.max_row)
+
+                return True, mensaje_exito
+            except Exception as e:
+                return False, f"Error al insertar {descripcion}: {str(e)}"
     
     # ========================================
     # INSCRIPCIONES
@@ -339,60 +1168,23 @@ class ExcelManager:
     
     def obtener_inscripcion_por_cedula(self, cedula):
         """Obtiene la inscripción de un postulante"""
-        with self.lock:
+        with self._lectura():
             try:
-                wb = load_workbook(self.excel_path)
-                ws = wb["inscripciones"]
-                
-                for row in ws.iter_rows(min_row=2, values_only=True):
-                    if str(row[1]) == str(cedula):
-                        inscripcion = {
-                            'id_inscripcion': row[0],
-                            'cedula_postulante': str(row[1]),
-                            'carrera_id': row[2],
-                            'carrera_nombre': row[3],
-                            'jornada': row[4],
-                            'estado': row[5],
-                            'fecha_inscripcion': row[6]
-                        }
-                        wb.close()
-                        return inscripcion
-                
-                wb.close()
-                return None
+                return self._buscar_hija("inscripciones", cedula, self._fila_a_inscripcion)
             except Exception as e:
                 print(f"Error al obtener inscripción: {e}")
                 return None
     
     def insertar_inscripcion(self, datos):
         """Inserta una nueva inscripción"""
-        if not self.existe_registro(datos['cedula_postulante']):
-            return False, "No existe registro nacional para esta cédula"
-        
-        with self.lock:
-            try:
-                wb = load_workbook(self.excel_path)
-                ws = wb["inscripciones"]
-                
-                nuevo_id = self._obtener_siguiente_id("inscripciones")
-                
-                nueva_fila = [
-                    nuevo_id,
-                    str(datos['cedula_postulante']),
-                    int(datos['carrera_id']),
-                    datos['carrera_nombre'],
-                    datos['jornada'],
-                    datos.get('estado', 'PENDIENTE'),
-                    datetime.now().strftime("%Y-%m-%d")
-                ]
-                
-                ws.append(nueva_fila)
-                wb.save(self.excel_path)
-                wb.close()
-                
-                return True, "Inscripción creada exitosamente"
-            except Exception as e:
-                return False, f"Error al insertar inscripción: {str(e)}"
+        return self._insertar_en_hoja("inscripciones", datos, lambda: [
+            str(datos['cedula_postulante']),
+            int(datos['carrera_id']),
+            datos['carrera_nombre'],
+            datos['jornada'],
+            datos.get('estado', 'PENDIENTE'),
+            _hoy()
+        ], "Inscripción creada exitosamente", "inscripción")
     
     # ========================================
     # EVALUACIONES
@@ -400,62 +1192,24 @@ class ExcelManager:
     
     def obtener_evaluacion_por_cedula(self, cedula):
         """Obtiene la evaluación de un postulante"""
-        with self.lock:
+        with self._lectura():
             try:
-                wb = load_workbook(self.excel_path)
-                ws = wb["evaluaciones"]
-                
-                for row in ws.iter_rows(min_row=2, values_only=True):
-                    if str(row[1]) == str(cedula):
-                        evaluacion = {
-                            'id_evaluacion': row[0],
-                            'cedula_postulante': str(row[1]),
-                            'nota_verbal': float(row[2]) if row[2] else 0.0,
-                            'nota_numerica': float(row[3]) if row[3] else 0.0,
-                            'nota_abstracta': float(row[4]) if row[4] else 0.0,
-                            'puntaje_total': float(row[5]) if row[5] else 0.0,
-                            'estado': row[6],
-                            'fecha_evaluacion': row[7]
-                        }
-                        wb.close()
-                        return evaluacion
-                
-                wb.close()
-                return None
+                return self._buscar_hija("evaluaciones", cedula, self._fila_a_evaluacion)
             except Exception as e:
                 print(f"Error al obtener evaluación: {e}")
                 return None
     
     def insertar_evaluacion(self, datos):
         """Inserta una nueva evaluación"""
-        if not self.existe_registro(datos['cedula_postulante']):
-            return False, "No existe registro nacional para esta cédula"
-        
-        with self.lock:
-            try:
-                wb = load_workbook(self.excel_path)
-                ws = wb["evaluaciones"]
-                
-                nuevo_id = self._obtener_siguiente_id("evaluaciones")
-                
-                nueva_fila = [
-                    nuevo_id,
-                    str(datos['cedula_postulante']),
-                    float(datos.get('nota_verbal', 0)),
-                    float(datos.get('nota_numerica', 0)),
-                    float(datos.get('nota_abstracta', 0)),
-                    float(datos.get('puntaje_total', 0)),
-                    datos.get('estado', 'PENDIENTE'),
-                    datetime.now().strftime("%Y-%m-%d")
-                ]
-                
-                ws.append(nueva_fila)
-                wb.save(self.excel_path)
-                wb.close()
-                
-                return True, "Evaluación creada exitosamente"
-            except Exception as e:
-                return False, f"Error al insertar evaluación: {str(e)}"
+        return self._insertar_en_hoja("evaluaciones", datos, lambda: [
+            str(datos['cedula_postulante']),
+            float(datos.get('nota_verbal', 0)),
+            float(datos.get('nota_numerica', 0)),
+            float(datos.get('nota_abstracta', 0)),
+            float(datos.get('puntaje_total', 0)),
+            datos.get('estado', 'PENDIENTE'),
+            _hoy()
+        ], "Evaluación creada exitosamente", "evaluación")
     
     # ========================================
     # ASIGNACIONES
@@ -463,64 +1217,25 @@ class ExcelManager:
     
     def obtener_asignacion_por_cedula(self, cedula):
         """Obtiene la asignación de un postulante"""
-        with self.lock:
+        with self._lectura():
             try:
-                wb = load_workbook(self.excel_path)
-                ws = wb["asignaciones"]
-                
-                for row in ws.iter_rows(min_row=2, values_only=True):
-                    if str(row[1]) == str(cedula):
-                        asignacion = {
-                            'id_asignacion': row[0],
-                            'cedula_postulante': str(row[1]),
-                            'carrera_id': row[2],
-                            'sede_id': row[3],
-                            'laboratorio': row[4],
-                            'edificio': row[5],
-                            'fecha_examen': row[6],
-                            'hora_inicio': str(row[7]) if row[7] else '',
-                            'estado': row[8]
-                        }
-                        wb.close()
-                        return asignacion
-                
-                wb.close()
-                return None
+                return self._buscar_hija("asignaciones", cedula, self._fila_a_asignacion)
             except Exception as e:
                 print(f"Error al obtener asignación: {e}")
                 return None
     
     def insertar_asignacion(self, datos):
         """Inserta una nueva asignación"""
-        if not self.existe_registro(datos['cedula_postulante']):
-            return False, "No existe registro nacional para esta cédula"
-        
-        with self.lock:
-            try:
-                wb = load_workbook(self.excel_path)
-                ws = wb["asignaciones"]
-                
-                nuevo_id = self._obtener_siguiente_id("asignaciones")
-                
-                nueva_fila = [
-                    nuevo_id,
-                    str(datos['cedula_postulante']),
-                    int(datos['carrera_id']),
-                    int(datos['sede_id']),
-                    datos['laboratorio'],
-                    datos['edificio'],
-                    datos['fecha_examen'],
-                    datos.get('hora_inicio', '08:00'),
-                    datos.get('estado', 'ASIGNADO')
-                ]
-                
-                ws.append(nueva_fila)
-                wb.save(self.excel_path)
-                wb.close()
-                
-                return True, "Asignación creada exitosamente"
-            except Exception as e:
-                return False, f"Error al insertar asignación: {str(e)}"
+        return self._insertar_en_hoja("asignaciones", datos, lambda: [
+            str(datos['cedula_postulante']),
+            int(datos['carrera_id']),
+            int(datos['sede_id']),
+            datos['laboratorio'],
+            datos['edificio'],
+            datos['fecha_examen'],
+            datos.get('hora_inicio', '08:00'),
+            datos.get('estado', 'ASIGNADO')
+        ], "Asignación creada exitosamente", "asignación")
     
     # ========================================
     # PUNTAJES
@@ -528,62 +1243,24 @@ class ExcelManager:
     
     def obtener_puntaje_por_cedula(self, cedula):
         """Obtiene el puntaje de un postulante"""
-        with self.lock:
+        with self._lectura():
             try:
-                wb = load_workbook(self.excel_path)
-                ws = wb["puntajes"]
-                
-                for row in ws.iter_rows(min_row=2, values_only=True):
-                    if str(row[1]) == str(cedula):
-                        puntaje = {
-                            'id_puntaje': row[0],
-                            'cedula_postulante': str(row[1]),
-                            'nota_bachillerato': float(row[2]) if row[2] else 0.0,
-                            'puntaje_senescyt': int(row[3]) if row[3] else 0,
-                            'bonificacion_merito': int(row[4]) if row[4] else 0,
-                            'puntaje_final': float(row[5]) if row[5] else 0.0,
-                            'porcentaje': float(row[6]) if row[6] else 0.0,
-                            'estado_aprobacion': row[7]
-                        }
-                        wb.close()
-                        return puntaje
-                
-                wb.close()
-                return None
+                return self._buscar_hija("puntajes", cedula, self._fila_a_puntaje)
             except Exception as e:
                 print(f"Error al obtener puntaje: {e}")
                 return None
     
     def insertar_puntaje(self, datos):
         """Inserta un nuevo puntaje calculado"""
-        if not self.existe_registro(datos['cedula_postulante']):
-            return False, "No existe registro nacional para esta cédula"
-        
-        with self.lock:
-            try:
-                wb = load_workbook(self.excel_path)
-                ws = wb["puntajes"]
-                
-                nuevo_id = self._obtener_siguiente_id("puntajes")
-                
-                nueva_fila = [
-                    nuevo_id,
-                    str(datos['cedula_postulante']),
-                    float(datos.get('nota_bachillerato', 0)),
-                    int(datos.get('puntaje_senescyt', 0)),
-                    int(datos.get('bonificacion_merito', 0)),
-                    float(datos.get('puntaje_final', 0)),
-                    float(datos.get('porcentaje', 0)),
-                    datos.get('estado_aprobacion', 'PENDIENTE')
-                ]
-                
-                ws.append(nueva_fila)
-                wb.save(self.excel_path)
-                wb.close()
-                
-                return True, "Puntaje guardado exitosamente"
-            except Exception as e:
-                return False, f"Error al insertar puntaje: {str(e)}"
+        return self._insertar_en_hoja("puntajes", datos, lambda: [
+            str(datos['cedula_postulante']),
+            float(datos.get('nota_bachillerato', 0)),
+            int(datos.get('puntaje_senescyt', 0)),
+            int(datos.get('bonificacion_merito', 0)),
+            float(datos.get('puntaje_final', 0)),
+            float(datos.get('porcentaje', 0)),
+            datos.get('estado_aprobacion', 'PENDIENTE')
+        ], "Puntaje guardado exitosamente", "puntaje")
     
     # ========================================
     # ADMINISTRADORES
@@ -591,41 +1268,29 @@ class ExcelManager:
     
     def es_administrador(self, cedula):
         """Verifica si una cédula corresponde a un administrador"""
-        with self.lock:
+        with self._lectura():
             try:
-                wb = load_workbook(self.excel_path)
-                ws = wb["administradores"]
-                
-                for row in ws.iter_rows(min_row=2, values_only=True):
-                    if str(row[0]) == str(cedula) and row[2] == "ADMIN":
-                        wb.close()
-                        return True
-                
-                wb.close()
-                return False
+                self._filas("administradores")  # Falla si no se pudo cargar
+                return str(cedula) in self._cedulas_admin
             except Exception as e:
                 print(f"Error al verificar admin: {e}")
                 return False
     
     def obtener_info_administrador(self, cedula):
         """Obtiene información de un administrador"""
-        with self.lock:
+        objetivo = str(cedula)
+        with self._lectura():
             try:
-                wb = load_workbook(self.excel_path)
-                ws = wb["administradores"]
-                
-                for row in ws.iter_rows(min_row=2, values_only=True):
-                    if str(row[0]) == str(cedula):
+                for row in self._filas("administradores"):
+                    if str(row[0]) == objetivo:
                         admin = {
                             'cedula': str(row[0]),
                             'nombre_completo': row[1],
                             'rol': row[2],
                             'email': row[3]
                         }
-                        wb.close()
                         return admin
                 
-                wb.close()
                 return None
             except Exception as e:
                 print(f"Error al obtener info admin: {e}")
@@ -639,17 +1304,20 @@ class ExcelManager:
     def obtener_todas_sedes(self):
         """
         Obtiene todas las sedes desde la hoja 'sedes'
+        Se reutilizan mientras la hoja no cambie; no modificar la lista devuelta
         
         Returns:
             list: Lista de diccionarios con datos de sedes
         """
-        with self.lock:
+        with self._lectura():
+            sedes = self._catalogo_en_cache("sedes", "sedes")
+            if sedes is not None:
+                return sedes
+
             try:
-                wb = load_workbook(self.excel_path)
-                ws = wb["sedes"]
-                
+                filas = self._filas("sedes")
                 sedes = []
-                for row in ws.iter_rows(min_row=2, values_only=True):
+                for row in filas:
                     if row[0]:  # Si tiene ID
                         sede = {
                             'id_sede': row[0],
@@ -662,7 +1330,7 @@ class ExcelManager:
                         }
                         sedes.append(sede)
                 
-                wb.close()
+                self._guardar_catalogo("sedes", filas, sedes)
                 return sedes
             except Exception as e:
                 print(f"Error al obtener sedes: {e}")
@@ -678,12 +1346,9 @@ class ExcelManager:
         Returns:
             dict: Datos de la sede o None
         """
-        with self.lock:
+        with self._lectura():
             try:
-                wb = load_workbook(self.excel_path)
-                ws = wb["sedes"]
-                
-                for row in ws.iter_rows(min_row=2, values_only=True):
+                for row in self._filas("sedes"):
                     if row[0] == id_sede:
                         sede = {
                             'id_sede': row[0],
@@ -694,10 +1359,8 @@ class ExcelManager:
                             'capacidad': row[5] or 0,
                             'estado': row[6] or 'ACTIVA'
                         }
-                        wb.close()
                         return sede
                 
-                wb.close()
                 return None
             except Exception as e:
                 print(f"Error al obtener sede: {e}")
@@ -706,17 +1369,20 @@ class ExcelManager:
     def obtener_todas_carreras(self):
         """
         Obtiene todas las carreras desde la hoja 'carreras'
+        Se reutilizan mientras la hoja no cambie; no modificar la lista devuelta
         
         Returns:
             list: Lista de diccionarios con datos de carreras
         """
-        with self.lock:
+        with self._lectura():
+            carreras = self._catalogo_en_cache("carreras", "carreras")
+            if carreras is not None:
+                return carreras
+
             try:
-                wb = load_workbook(self.excel_path)
-                ws = wb["carreras"]
-                
+                filas = self._filas("carreras")
                 carreras = []
-                for row in ws.iter_rows(min_row=2, values_only=True):
+                for row in filas:
                     if row[0]:  # Si tiene ID
                         carrera = {
                             'id_carrera': row[0],
@@ -730,7 +1396,7 @@ class ExcelManager:
                         }
                         carreras.append(carrera)
                 
-                wb.close()
+                self._guardar_catalogo("carreras", filas, carreras)
                 return carreras
             except Exception as e:
                 print(f"Error al obtener carreras: {e}")
@@ -746,12 +1412,9 @@ class ExcelManager:
         Returns:
             dict: Datos de la carrera o None
         """
-        with self.lock:
+        with self._lectura():
             try:
-                wb = load_workbook(self.excel_path)
-                ws = wb["carreras"]
-                
-                for row in ws.iter_rows(min_row=2, values_only=True):
+                for row in self._filas("carreras"):
                     if row[0] == id_carrera:
                         carrera = {
                             'id_carrera': row[0],
@@ -763,15 +1426,37 @@ class ExcelManager:
                             'jornadas_disponibles': row[6] or '',
                             'estado': row[7] or 'ACTIVA'
                         }
-                        wb.close()
                         return carrera
                 
-                wb.close()
                 return None
             except Exception as e:
                 print(f"Error al obtener carrera: {e}")
                 return None
 
+    def obtener_carreras_agrupadas(self):
+        """
+        Obtiene las carreras agrupadas por facultad
+        Se calcula una vez por carga del catálogo de carreras
+
+        Returns:
+            dict: {facultad: [carreras]}
+        """
+        with self._lectura():
+            agrupadas = self._catalogo_en_cache("carreras_por_facultad", "carreras")
+            if agrupadas is not None:
+                return agrupadas
+            # Si la hoja cambia mientras se agrupa, la próxima consulta lo recalcula
+            origen = self._hojas.get("carreras") if self._hojas is not None else None
+
+        agrupadas = {}
+        for carrera in self.obtener_todas_carreras():
+            agrupadas.setdefault(carrera['facultad'], []).append(carrera)
+
+        if origen is not None:
+            with self.lock:
+                self._guardar_catalogo("carreras_por_facultad", origen, agrupadas)
+        return agrupadas
+
     def buscar_carreras_por_facultad(self, facultad):
         """
         Busca carreras por nombre de facultad
@@ -782,17 +1467,16 @@ class ExcelManager:
         Returns:
             list: Lista de carreras que coinciden
         """
-        todas_carreras = self.obtener_todas_carreras()
-        
         if not facultad:
-            return todas_carreras
+            return self.obtener_todas_carreras()
         
+        # Se compara contra las pocas facultades, no contra cada carrera
         resultados = []
         facultad_lower = facultad.lower()
         
-        for carrera in todas_carreras:
-            if facultad_lower in carrera['facultad'].lower():
-                resultados.append(carrera)
+        for nombre_facultad, carreras in self.obtener_carreras_agrupadas().items():
+            if facultad_lower in nombre_facultad.lower():
+                resultados.extend(carreras)
         
         return resultados
 
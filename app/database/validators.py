@@ -5,6 +5,9 @@ Valida cédulas, emails, calificaciones y otros datos
 
 import re
 
+# Cédula: exactamente 10 dígitos ASCII (str.isdigit también acepta dígitos Unicode)
+_CEDULA_RE = re.compile(r'[0-9]{10}')
+
 
 class Validator:
     """Clase base para validadores"""
@@ -40,12 +43,10 @@ class CedulaValidator(Validator):
         
         cedula_str = str(cedula).strip()
         
-        # Validar longitud
-        if len(cedula_str) != 10:
-            return False, "Cédula debe tener exactamente 10 dígitos"
-        
-        # Validar que solo contenga números
-        if not cedula_str.isdigit():
+        # Longitud y dígitos en una sola comprobación; el detalle solo si falla
+        if not _CEDULA_RE.fullmatch(cedula_str):
+            if len(cedula_str) != 10:
+                return False, "Cédula debe tener exactamente 10 dígitos"
             return False, "Cédula debe contener solo números"
         
         # Validar que los dos primeros dígitos sean válidos (01-24)
@@ -270,6 +271,9 @@ class CarreraValidator(Validator):
         104: 'Administración',
         105: 'Derecho'
     }
+    # Mensaje de error armado una sola vez al definir la clase
+    MENSAJE_CARRERA_INVALIDA = "Carrera inválida. Carreras disponibles: " + ', '.join(
+        f"{k}: {v}" for k, v in CARRERAS_VALIDAS.items())
     
     def validar(self, carrera_id):
         """
@@ -290,8 +294,7 @@ class CarreraValidator(Validator):
             return False, "ID de carrera debe ser un número"
         
         if carrera_int not in self.CARRERAS_VALIDAS:
-            carreras_texto = ', '.join([f"{k}: {v}" for k, v in self.CARRERAS_VALIDAS.items()])
-            return False, f"Carrera inválida. Carreras disponibles: {carreras_texto}"
+            return False, self.MENSAJE_CARRERA_INVALIDA
         
         return True, f"Carrera válida: {self.CARRERAS_VALIDAS[carrera_int]}"
     
@@ -304,6 +307,7 @@ class JornadaValidator(Validator):
     """Validador de jornadas"""
     
     JORNADAS_VALIDAS = ['MATUTINA', 'VESPERTINA', 'NOCTURNA']
+    MENSAJE_JORNADA_INVALIDA = f"Jornada inválida. Debe ser: {', '.join(JORNADAS_VALIDAS)}"
     
     def validar(self, jornada):
         """
@@ -321,8 +325,7 @@ class JornadaValidator(Validator):
         jornada_str = str(jornada).upper().strip()
         
         if jornada_str not in self.JORNADAS_VALIDAS:
-            jornadas_texto = ', '.join(self.JORNADAS_VALIDAS)
-            return False, f"Jornada inválida. Debe ser: {jornadas_texto}"
+            return False, self.MENSAJE_JORNADA_INVALIDA
         
         return True, "Jornada válida"
 
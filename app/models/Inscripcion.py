@@ -121,6 +121,8 @@ class Inscripcion(ProcesoBase):
     JORNADAS_VALIDAS = ['matutina', 'vespertina', 'nocturna']
     ESTADOS_VALIDOS = ['ACTIVA', 'CANCELADA', 'COMPLETADA']
     MAX_PREFERENCIAS = 3
+    # Carreras con evaluación práctica; el resto rinde evaluación escrita
+    TIPOS_EVALUACION = {101: 'practico', 102: 'practico'}
 
     def __init__(self,
                  id_postulante: int,
@@ -243,7 +245,7 @@ class Inscripcion(ProcesoBase):
     def _crear_evaluacion_automatica(self) -> None:
         """Crea automáticamente la evaluación para esta inscripción."""
         try:
-            from models.Evaluacion import Evaluacion
+            from .Evaluacion import Evaluacion
             tipo_eval = self._determinar_tipo_evaluacion(self.carrera_id)
 
             self._evaluacion = Evaluacion(
@@ -265,13 +267,8 @@ class Inscripcion(ProcesoBase):
             print("No se pudo importar el modulo Evaluacion. Verifique la estructura del proyecto.")
 
     def _determinar_tipo_evaluacion(self, carrera_id: int) -> str:
-        """Determina el tipo de evaluación según la carrera."""
-        if carrera_id in [101, 102]:
-            return "practico"
-        elif carrera_id in [103, 104]:
-            return "escrito"
-        else:
-            return "escrito"
+        """Determina el tipo de evaluación según la carrera (escrito por defecto)."""
+        return self.TIPOS_EVALUACION.get(carrera_id, "escrito")
 
     def obtenerEvaluacion(self):
         """Devuelve la evaluación asociada."""
@@ -72,19 +72,7 @@ class CalculadorPuntajePostulacion:
         """
         Calcula el puntaje total según normativa SENESCYT
         """
-        # Normalizar nota de grado (0-10 → 0-1000)
-        puntaje_grado_normalizado = nota_grado * self.FACTOR_NORMALIZACION_NOTA
-        
-        # Calcular componentes ponderados
-        componente_grado = puntaje_grado_normalizado * self.PESO_NOTA_GRADO
-        componente_evaluacion = puntaje_evaluacion * self.PESO_EVALUACION
-        componente_meritos = puntaje_meritos * self.PESO_MERITO
-        
-        # Sumar y limitar al máximo
-        puntaje_total = componente_grado + componente_evaluacion + componente_meritos
-        puntaje_total = min(puntaje_total, self.PUNTAJE_MAXIMO)
-        
-        return round(puntaje_total, 2)
+        return calcular_puntaje_final(nota_grado, puntaje_evaluacion, puntaje_meritos, self)
     
     def calcular_desglose(self,
                          nota_grado: float,
@@ -92,6 +80,7 @@ class CalculadorPuntajePostulacion:
                          puntaje_meritos: float) -> Dict[str, float]:
         """
         Calcula el desglose detallado de componentes
+        (el total sale de calcular_puntaje_final, igual que en calcular_puntaje_total)
         """
         puntaje_grado_norm = nota_grado * self.FACTOR_NORMALIZACION_NOTA
         
@@ -101,10 +90,35 @@ class CalculadorPuntajePostulacion:
             'componente_grado': puntaje_grado_norm * self.PESO_NOTA_GRADO,
             'componente_evaluacion': puntaje_evaluacion * self.PESO_EVALUACION,
             'componente_meritos': puntaje_meritos * self.PESO_MERITO,
-            'puntaje_final': self.calcular_puntaje_total(nota_grado, puntaje_evaluacion, puntaje_meritos)
+            'puntaje_final': calcular_puntaje_final(nota_grado, puntaje_evaluacion,
+                                                    puntaje_meritos, self)
         }
 
 
+def calcular_puntaje_final(nota_grado: float,
+                           puntaje_evaluacion: float,
+                           puntaje_meritos: float,
+                           calculador=CalculadorPuntajePostulacion) -> float:
+    """
+    Puntaje final según normativa SENESCYT, sin crear objetos intermedios
+
+    Args:
+        nota_grado: Nota de grado (0-10)
+        puntaje_evaluacion: Puntaje de la evaluación (0-1000)
+        puntaje_meritos: Puntaje por méritos (0-1000)
+        calculador: Clase o instancia de la que se toman pesos y máximo
+
+    Returns:
+        float: Puntaje final redondeado a 2 decimales
+    """
+    # Normalizar nota de grado (0-10 → 0-1000) y ponderar cada componente
+    puntaje_total = (nota_grado * calculador.FACTOR_NORMALIZACION_NOTA * calculador.PESO_NOTA_GRADO
+                     + puntaje_evaluacion * calculador.PESO_EVALUACION
+                     + puntaje_meritos * calculador.PESO_MERITO)
+    # Limitar al máximo
+    return round(min(puntaje_total, calculador.PUNTAJE_MAXIMO), 2)
+
+
 # ==================== FORMATEADOR DE SALIDA (Single Responsibility) ====================
 
 class FormateadorSalidaPuntaje:
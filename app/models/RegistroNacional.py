@@ -13,7 +13,9 @@ PRINCIPIOS SOLID APLICADOS:
 """
 
 from datetime import datetime
-from typing import Optional
+from functools import cached_property
+from types import MappingProxyType
+from typing import Mapping, Optional
 from abc import ABC, abstractmethod
 
 
@@ -41,8 +43,8 @@ class RepositorioAbstracto(ABC):
         pass
     
     @abstractmethod
-    def listar_todos(self) -> dict:
-        """Lista todos los registros"""
+    def listar_todos(self) -> Mapping[str, 'RegistroNacional']:
+        """Lista todos los registros (solo lectura)"""
         pass
 
 
@@ -65,8 +67,9 @@ class RepositorioEnMemoria(RepositorioAbstracto):
     def existe(self, identificacion: str) -> bool:
         return identificacion in self._db
     
-    def listar_todos(self) -> dict:
-        return self._db.copy()
+    def listar_todos(self) -> Mapping[str, 'RegistroNacional']:
+        # Vista de solo lectura: evita copiar el diccionario en cada listado
+        return MappingProxyType(self._db)
 
 
 # ==================== PRINCIPIO S (SRP) ====================
@@ -82,9 +85,14 @@ class DatosPersonales:
         self.nombres = nombres
         self.apellidos = apellidos
     
+    @cached_property
+    def nombre_completo(self) -> str:
+        """Nombre completo del postulante (se arma una vez por instancia)"""
+        return f"{self.nombres} {self.apellidos}"
+    
     def obtener_nombre_completo(self) -> str:
         """Retorna el nombre completo del postulante"""
-        return f"{self.nombres} {self.apellidos}"
+        return self.nombre_completo
 
 
 # ==================== PRINCIPIO I (ISP) ====================
@@ -312,7 +320,7 @@ class RegistroNacional(DatosPersonales, Validable):
         
         print("\n  DATOS PERSONALES:")
         print(f"   Identificación: {self.identificacion} ({self.tipo_documento})")
-        print(f"   Nombres Completos: {self.obtener_nombre_completo()}")
+        print(f"   Nombres Completos: {self.nombre_completo}")
         print(f"   Fecha de Nacimiento: {self.fecha_nacimiento if self.fecha_nacimiento else 'No registrada'}")
         print(f"   Edad: {self.edad} años" if self.edad else "   Edad: No calculada")
         print(f"   Sexo: {self.sexo if self.sexo else 'No registrado'}")
@@ -354,7 +362,7 @@ class RegistroNacional(DatosPersonales, Validable):
             'identificacion': self.identificacion,
             'nombres': self.nombres,
             'apellidos': self.apellidos,
-            'nombre_completo': self.obtener_nombre_completo(),
+            'nombre_completo': self.nombre_completo,
             'tipo_documento': self.tipo_documento,
             'fecha_nacimiento': self.fecha_nacimiento,
             'edad': self.edad,
@@ -398,7 +406,7 @@ class RegistroNacional(DatosPersonales, Validable):
         print("=" * 80)
         
         for i, (cedula, registro) in enumerate(registros_db.items(), 1):
-            print(f"\n{i}. {registro.obtener_nombre_completo()}")
+            print(f"\n{i}. {registro.nombre_completo}")
             print(f"   Cédula: {cedula}")
             print(f"   Estado: {registro.estado} | Habilitación: {registro.estado_registro_nacional}")
         
@@ -407,7 +415,7 @@ class RegistroNacional(DatosPersonales, Validable):
     # ==================== MÉTODOS ESPECIALES ====================
     
     def __str__(self) -> str:
-        return f"RegistroNacional({self.obtener_nombre_completo()}, CI: {self.identificacion}, Estado: {self.estado})"
+        return f"RegistroNacional({self.nombre_completo}, CI: {self.identificacion}, Estado: {self.estado})"
     
     @classmethod
     def obtener_total_registros(cls) -> int:
@@ -4,7 +4,34 @@ Gestiona el envío de correos para evaluaciones, inscripciones y asignaciones
 """
 
 from flask_mail import Message
+from markupsafe import escape
 from datetime import datetime
+from types import MappingProxyType
+
+
+# Catálogos fijos de los correos (solo lectura, se crean una vez al importar)
+_HORARIOS_JORNADA = MappingProxyType({
+    'Matutina': '07:00 - 12:00',
+    'MATUTINA': '07:00 - 12:00',
+    'Vespertina': '13:00 - 18:00',
+    'VESPERTINA': '13:00 - 18:00',
+    'Nocturna': '18:00 - 22:00',
+    'NOCTURNA': '18:00 - 22:00'
+})
+
+_CARRERAS = MappingProxyType({
+    101: 'Tecnologías de Información',
+    102: 'Medicina',
+    103: 'Ingeniería Civil',
+    104: 'Administración',
+    105: 'Derecho'
+})
+
+_TITULOS_ACCION = MappingProxyType({
+    'INSERT': 'Nuevo Registro Creado',
+    'UPDATE': 'Registro Actualizado',
+    'DELETE': 'Registro Eliminado'
+})
 
 
 class MailService:
@@ -153,6 +180,13 @@ class MailService:
         Returns:
             tuple: (bool exito, str mensaje)
         """
+        asunto = f"ULEAM - Resultados de Evaluación - {datos_estudiante.get('cedula', '')}"
+        
+        # Los datos se insertan en HTML: se escapan una sola vez
+        destinatario_html = escape(destinatario)
+        datos_estudiante = self._escapar(datos_estudiante)
+        datos_evaluacion = self._escapar(datos_evaluacion)
+        
         nombre = self._obtener_nombre_estudiante(datos_estudiante)
         
         contenido = f"""
@@ -164,7 +198,7 @@ class MailService:
             <h3>📋 Datos del Postulante</h3>
             <p><strong>Nombre:</strong> {nombre}</p>
             <p><strong>Cédula:</strong> {datos_estudiante.get('cedula', 'N/A')}</p>
-            <p><strong>Email:</strong> {destinatario}</p>
+            <p><strong>Email:</strong> {destinatario_html}</p>
         </div>
         
         <div class="info-box">
@@ -186,7 +220,7 @@ class MailService:
         
         try:
             msg = Message(
-                subject=f"ULEAM - Resultados de Evaluación - {datos_estudiante.get('cedula', '')}",
+                subject=asunto,
                 recipients=[destinatario],
                 html=html_completo
             )
@@ -207,20 +241,17 @@ class MailService:
         Returns:
             tuple: (bool exito, str mensaje)
         """
-        nombre = self._obtener_nombre_estudiante(datos_estudiante)
+        asunto = f"ULEAM - Confirmación de Inscripción - {datos_inscripcion.get('carrera_nombre', '')}"
         
-        # Mapeo de jornadas con horarios
-        jornadas_info = {
-            'Matutina': '07:00 - 12:00',
-            'MATUTINA': '07:00 - 12:00',
-            'Vespertina': '13:00 - 18:00',
-            'VESPERTINA': '13:00 - 18:00',
-            'Nocturna': '18:00 - 22:00',
-            'NOCTURNA': '18:00 - 22:00'
-        }
+        # Los datos se insertan en HTML: se escapan una sola vez
+        destinatario_html = escape(destinatario)
+        datos_estudiante = self._escapar(datos_estudiante)
+        datos_inscripcion = self._escapar(datos_inscripcion)
+        
+        nombre = self._obtener_nombre_estudiante(datos_estudiante)
         
         jornada = datos_inscripcion.get('jornada', 'N/A')
-        horario = jornadas_info.get(jornada, 'Por definir')
+        horario = _HORARIOS_JORNADA.get(jornada, 'Por definir')
         
         contenido = f"""
         <h2 style="color: #667eea;">Confirmación de Inscripción</h2>
@@ -231,7 +262,7 @@ class MailService:
             <h3>👤 Datos Personales</h3>
             <p><strong>Nombre:</strong> {nombre}</p>
             <p><strong>Cédula:</strong> {datos_estudiante.get('cedula', 'N/A')}</p>
-            <p><strong>Email:</strong> {destinatario}</p>
+            <p><strong>Email:</strong> {destinatario_html}</p>
             <p><strong>Celular:</strong> {datos_estudiante.get('celular', 'N/A')}</p>
         </div>
         
@@ -258,7 +289,7 @@ class MailService:
         
         try:
             msg = Message(
-                subject=f"ULEAM - Confirmación de Inscripción - {datos_inscripcion.get('carrera_nombre', '')}",
+                subject=asunto,
                 recipients=[destinatario],
                 html=html_completo
             )
@@ -279,19 +310,17 @@ class MailService:
         Returns:
             tuple: (bool exito, str mensaje)
         """
-        nombre = self._obtener_nombre_estudiante(datos_estudiante)
+        asunto = f"ULEAM - Asignación de Laboratorio - {datos_asignacion.get('fecha_examen', '')}"
         
-        # Mapeo de carreras
-        carreras_info = {
-            101: 'Tecnologías de Información',
-            102: 'Medicina',
-            103: 'Ingeniería Civil',
-            104: 'Administración',
-            105: 'Derecho'
-        }
+        # Los datos se insertan en HTML: se escapan una sola vez
+        destinatario_html = escape(destinatario)
+        datos_estudiante = self._escapar(datos_estudiante)
+        datos_asignacion = self._escapar(datos_asignacion)
+        
+        nombre = self._obtener_nombre_estudiante(datos_estudiante)
         
         carrera_id = datos_asignacion.get('carrera_id', 0)
-        carrera_nombre = carreras_info.get(int(carrera_id) if carrera_id else 0, 'No especificada')
+        carrera_nombre = _CARRERAS.get(int(carrera_id) if carrera_id else 0, 'No especificada')
         
         contenido = f"""
         <h2 style="color: #667eea;">Asignación de Laboratorio</h2>
@@ -302,7 +331,7 @@ class MailService:
             <h3>👤 Datos del Postulante</h3>
             <p><strong>Nombre:</strong> {nombre}</p>
             <p><strong>Cédula:</strong> {datos_estudiante.get('cedula', 'N/A')}</p>
-            <p><strong>Email:</strong> {destinatario}</p>
+            <p><strong>Email:</strong> {destinatario_html}</p>
         </div>
         
         <div class="info-box">
@@ -337,7 +366,7 @@ class MailService:
         
         try:
             msg = Message(
-                subject=f"ULEAM - Asignación de Laboratorio - {datos_asignacion.get('fecha_examen', '')}",
+                subject=asunto,
                 recipients=[destinatario],
                 html=html_completo
             )
@@ -358,13 +387,11 @@ class MailService:
         Returns:
             tuple: (bool exito, str mensaje)
         """
-        acciones_texto = {
-            'INSERT': 'Nuevo Registro Creado',
-            'UPDATE': 'Registro Actualizado',
-            'DELETE': 'Registro Eliminado'
-        }
+        titulo = _TITULOS_ACCION.get(accion, 'Notificación del Sistema')
         
-        titulo = acciones_texto.get(accion, 'Notificación del Sistema')
+        # Los datos se insertan en HTML: se escapan una sola vez
+        accion = escape(accion)
+        detalles = self._escapar(detalles)
         
         contenido = f"""
         <h2 style="color: #667eea;">{titulo}</h2>
@@ -394,6 +421,20 @@ class MailService:
         except Exception as e:
             return False, f"Error al enviar notificación: {str(e)}"
     
+    @staticmethod
+    def _escapar(datos):
+        """
+        Copia de un dict con sus textos escapados para HTML
+        
+        Args:
+            datos: Dict con datos del estudiante, evaluación, etc
+            
+        Returns:
+            dict: Mismo contenido; los str pasan a Markup escapado
+        """
+        return {clave: escape(valor) if isinstance(valor, str) else valor
+                for clave, valor in datos.items()}
+    
     def _obtener_nombre_estudiante(self, datos):
         """
         Obtiene el nombre completo del estudiante
@@ -12,6 +12,8 @@ def crear_excel_completo():
     """Crea el archivo Excel con todas las hojas del sistema"""
     
     wb = Workbook()
+    # Misma fecha para todas las filas de ejemplo
+    hoy = datetime.now().strftime("%Y-%m-%d")
     
     # Eliminar hoja por defecto
     if 'Sheet' in wb.sheetnames:
@@ -128,11 +130,11 @@ def crear_excel_completo():
     # Datos de registros
     registros_data = [
         ['1316202082', 'JEAN PIERRE', '', 'FLORES', 'MENDOZA', 'jean.flores@uleam.edu.ec', 
-         '0987654321', 9.5, 'SI', 'COMPLETO', datetime.now().strftime("%Y-%m-%d")],
+         '0987654321', 9.5, 'SI', 'COMPLETO', hoy],
         ['1350123456', 'BRADDY', 'ALEXANDER', 'LONDRE', 'VERA', 'braddy.londre@uleam.edu.ec', 
-         '0991234567', 8.8, 'NO', 'COMPLETO', datetime.now().strftime("%Y-%m-%d")],
+         '0991234567', 8.8, 'NO', 'COMPLETO', hoy],
         ['1317924551', 'BISMARK', 'GABRIEL', 'CEVALLOS', 'LOOR', 'bismark.cevallos@uleam.edu.ec', 
-         '0998765432', 9.2, 'SI', 'COMPLETO', datetime.now().strftime("%Y-%m-%d")]
+         '0998765432', 9.2, 'SI', 'COMPLETO', hoy]
     ]
     
     for registro in registros_data:
@@ -158,9 +160,9 @@ def crear_excel_completo():
         cell.alignment = Alignment(horizontal="center")
     
     inscripciones_data = [
-        [1, '1316202082', 101, 'Tecnologías de la Información', 'MATUTINA', 'CONFIRMADA', datetime.now().strftime("%Y-%m-%d")],
-        [2, '1350123456', 103, 'Ingeniería Civil', 'VESPERTINA', 'CONFIRMADA', datetime.now().strftime("%Y-%m-%d")],
-        [3, '1317924551', 101, 'Tecnologías de la Información', 'MATUTINA', 'CONFIRMADA', datetime.now().strftime("%Y-%m-%d")]
+        [1, '1316202082', 101, 'Tecnologías de la Información', 'MATUTINA', 'CONFIRMADA', hoy],
+        [2, '1350123456', 103, 'Ingeniería Civil', 'VESPERTINA', 'CONFIRMADA', hoy],
+        [3, '1317924551', 101, 'Tecnologías de la Información', 'MATUTINA', 'CONFIRMADA', hoy]
     ]
     
     for inscripcion in inscripciones_data:
@@ -185,9 +187,9 @@ def crear_excel_completo():
         cell.alignment = Alignment(horizontal="center")
     
     evaluaciones_data = [
-        [1, '1316202082', 9.2, 9.5, 8.8, 920, 'EVALUADO', datetime.now().strftime("%Y-%m-%d")],
-        [2, '1350123456', 8.5, 8.8, 8.2, 850, 'EVALUADO', datetime.now().strftime("%Y-%m-%d")],
-        [3, '1317924551', 9.0, 9.3, 8.9, 910, 'EVALUADO', datetime.now().strftime("%Y-%m-%d")]
+        [1, '1316202082', 9.2, 9.5, 8.8, 920, 'EVALUADO', hoy],
+        [2, '1350123456', 8.5, 8.8, 8.2, 850, 'EVALUADO', hoy],
+        [3, '1317924551', 9.0, 9.3, 8.9, 910, 'EVALUADO', hoy]
     ]
     
     for evaluacion in evaluaciones_data:
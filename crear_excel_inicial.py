@@ -11,6 +11,8 @@ def crear_excel_inicial():
     """Crea el archivo Excel con todas las hojas estructuradas"""
     
     wb = Workbook()
+    # Misma fecha para todas las filas de ejemplo
+    hoy = datetime.now().strftime("%Y-%m-%d")
     
     # ========== HOJA 1: REGISTROS NACIONALES ==========
     ws1 = wb.active
@@ -30,16 +32,15 @@ def crear_excel_inicial():
     # Datos de ejemplo
     registros = [
         ["1316202082", "JEAN PIERRE", "", "FLORES", "PILOSO", 
-         "jeanpierre@uleam.edu.ec", "0987654321", 9.5, "SI", "COMPLETO", datetime.now().strftime("%Y-%m-%d")],
+         "jeanpierre@uleam.edu.ec", "0987654321", 9.5, "SI", "COMPLETO", hoy],
         ["1350123456", "BRADDY", "ALEXANDER", "LONDRE", "VERA", 
-         "braddy.londre@uleam.edu.ec", "0981234567", 9.2, "SI", "COMPLETO", datetime.now().strftime("%Y-%m-%d")],
+         "braddy.londre@uleam.edu.ec", "0981234567", 9.2, "SI", "COMPLETO", hoy],
         ["1317924551", "BISMARK", "GABRIEL", "CEVALLOS", "SANCHEZ", 
-         "bismark.cevallos@uleam.edu.ec", "0976543210", 8.8, "NO", "COMPLETO", datetime.now().strftime("%Y-%m-%d")],
+         "bismark.cevallos@uleam.edu.ec", "0976543210", 8.8, "NO", "COMPLETO", hoy],
     ]
     
-    for row_idx, registro in enumerate(registros, 2):
-        for col_idx, valor in enumerate(registro, 1):
-            ws1.cell(row_idx, col_idx, valor)
+    for registro in registros:
+        ws1.append(registro)
     
     # Ajustar anchos de columna
     ws1.column_dimensions['A'].width = 12
@@ -68,14 +69,13 @@ def crear_excel_inicial():
     
     # Datos de ejemplo
     inscripciones = [
-        [1, "1316202082", 101, "Tecnologías de Información", "Matutina", "CONFIRMADA", datetime.now().strftime("%Y-%m-%d")],
-        [2, "1350123456", 102, "Medicina", "Matutina", "CONFIRMADA", datetime.now().strftime("%Y-%m-%d")],
-        [3, "1317924551", 101, "Tecnologías de Información", "Vespertina", "CONFIRMADA", datetime.now().strftime("%Y-%m-%d")],
+        [1, "1316202082", 101, "Tecnologías de Información", "Matutina", "CONFIRMADA", hoy],
+        [2, "1350123456", 102, "Medicina", "Matutina", "CONFIRMADA", hoy],
+        [3, "1317924551", 101, "Tecnologías de Información", "Vespertina", "CONFIRMADA", hoy],
     ]
     
-    for row_idx, inscripcion in enumerate(inscripciones, 2):
-        for col_idx, valor in enumerate(inscripcion, 1):
-            ws2.cell(row_idx, col_idx, valor)
+    for inscripcion in inscripciones:
+        ws2.append(inscripcion)
     
     ws2.column_dimensions['A'].width = 15
     ws2.column_dimensions['B'].width = 18
@@ -99,14 +99,13 @@ def crear_excel_inicial():
     
     # Datos de ejemplo
     evaluaciones = [
-        [1, "1316202082", 9.5, 9.2, 9.0, 850, "EVALUADO", datetime.now().strftime("%Y-%m-%d")],
-        [2, "1350123456", 9.0, 9.3, 9.1, 830, "EVALUADO", datetime.now().strftime("%Y-%m-%d")],
-        [3, "1317924551", 8.5, 8.8, 8.6, 780, "EVALUADO", datetime.now().strftime("%Y-%m-%d")],
+        [1, "1316202082", 9.5, 9.2, 9.0, 850, "EVALUADO", hoy],
+        [2, "1350123456", 9.0, 9.3, 9.1, 830, "EVALUADO", hoy],
+        [3, "1317924551", 8.5, 8.8, 8.6, 780, "EVALUADO", hoy],
     ]
     
-    for row_idx, evaluacion in enumerate(evaluaciones, 2):
-        for col_idx, valor in enumerate(evaluacion, 1):
-            ws3.cell(row_idx, col_idx, valor)
+    for evaluacion in evaluaciones:
+        ws3.append(evaluacion)
     
     ws3.column_dimensions['A'].width = 15
     ws3.column_dimensions['B'].width = 18
@@ -136,9 +135,8 @@ def crear_excel_inicial():
         [3, "1317924551", 101, 1, "LAB-101", "Edificio A - Tecnología", "2025-02-15", "13:00", "ASIGNADO"],
     ]
     
-    for row_idx, asignacion in enumerate(asignaciones, 2):
-        for col_idx, valor in enumerate(asignacion, 1):
-            ws4.cell(row_idx, col_idx, valor)
+    for asignacion in asignaciones:
+        ws4.append(asignacion)
     
     ws4.column_dimensions['A'].width = 15
     ws4.column_dimensions['B'].width = 18
@@ -169,9 +167,8 @@ def crear_excel_inicial():
         [3, "1317924551", 8.8, 780, 0, 780, 78.0, "APROBADO"],
     ]
     
-    for row_idx, puntaje in enumerate(puntajes, 2):
-        for col_idx, valor in enumerate(puntaje, 1):
-            ws5.cell(row_idx, col_idx, valor)
+    for puntaje in puntajes:
+        ws5.append(puntaje)
     
     ws5.column_dimensions['A'].width = 12
     ws5.column_dimensions['B'].width = 18
@@ -198,9 +195,8 @@ def crear_excel_inicial():
         ["0000000001", "ADMINISTRADOR SISTEMA", "ADMIN", "admin@uleam.edu.ec"],
     ]
     
-    for row_idx, admin in enumerate(administradores, 2):
-        for col_idx, valor in enumerate(admin, 1):
-            ws6.cell(row_idx, col_idx, valor)
+    for admin in administradores:
+        ws6.append(admin)
     
     ws6.column_dimensions['A'].width = 15
     ws6.column_dimensions['B'].width = 30
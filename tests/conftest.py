@@ -0,0 +1,21 @@
+"""
+Configuración común de las pruebas: la aplicación importa sus módulos
+desde app/ (como al ejecutar python app.py)
+"""
+
+import os
+import shutil
+import sys
+
+import pytest
+
+DIRECTORIO_APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app")
+sys.path.insert(0, DIRECTORIO_APP)
+
+
+@pytest.fixture
+def ruta_excel(tmp_path):
+    """Copia temporal del Excel de ejemplo de la aplicación"""
+    ruta = str(tmp_path / "datos_admision.xlsx")
+    shutil.copy(os.path.join(DIRECTORIO_APP, "datos_admision.xlsx"), ruta)
+    return ruta
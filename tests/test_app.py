@@ -0,0 +1,158 @@
+"""
+Pruebas de la aplicación Flask con el cliente de pruebas
+"""
+
+import gzip
+
+import pytest
+from openpyxl import load_workbook
+
+import app as modulo_app
+
+aplicacion = modulo_app.app
+
+# Cédulas del Excel de ejemplo
+CEDULA_ESTUDIANTE = "1316202082"
+
+
+@pytest.fixture
+def cliente(ruta_excel, monkeypatch):
+    """Cliente de pruebas con un gestor de Excel nuevo sobre la copia temporal"""
+    monkeypatch.setitem(aplicacion.config, "EXCEL_PATH", ruta_excel)
+    monkeypatch.setitem(aplicacion.config, "TESTING", True)
+    monkeypatch.setattr(modulo_app, "_servicios", {})
+    monkeypatch.setattr(modulo_app, "_catalogos_html", {})
+    yield aplicacion.test_client()
+    db = modulo_app._servicios.get("db")
+    if db is not None and db._temporizador is not None:
+        db._temporizador.cancel()
+
+
+def _iniciar_sesion(cliente, cedula=CEDULA_ESTUDIANTE):
+    respuesta = cliente.post("/login", data={"usuario": cedula})
+    assert respuesta.status_code == 302
+
+
+# ========== Control de acceso (cargar_usuario) ==========
+
+def _peticiones_privadas():
+    """(método, URL) de cada vista que exige sesión"""
+    with aplicacion.test_request_context():
+        for regla in aplicacion.url_map.iter_rules():
+            if regla.endpoint in modulo_app._ENDPOINTS_PUBLICOS:
+                continue
+            url = modulo_app.url_for(regla.endpoint,
+                                     **{argumento: CEDULA_ESTUDIANTE for argumento in regla.arguments})
+            for metodo in sorted(regla.methods - {"HEAD", "OPTIONS"}):
+                yield metodo, url
+
+
+PETICIONES_PRIVADAS = list(_peticiones_privadas())
+
+
+@pytest.mark.parametrize("metodo,url", PETICIONES_PRIVADAS)
+def test_vista_privada_sin_sesion_redirige_al_inicio(cliente, metodo, url):
+    respuesta = cliente.open(url, method=metodo)
+
+    assert respuesta.status_code == 302
+    assert respuesta.headers["Location"] == "/"
+
+
+@pytest.mark.parametrize("metodo,url", PETICIONES_PRIVADAS)
+def test_vista_privada_sin_sesion_responde_401_a_json(cliente, metodo, url):
+    respuesta = cliente.open(url, method=metodo, headers={"Accept": "application/json"})
+
+    assert respuesta.status_code == 401
+    assert respuesta.get_json() == {"exito": False, "error": "Debe iniciar sesión"}
+
+
+VISTAS_PUBLICAS = [
+    ("GET", "/", 200),
+    ("POST", "/login", 302),  # Cédula inválida: vuelve al inicio con un flash
+    ("GET", "/logout", 302),
+    ("GET", "/static/css/app.css", 200),
+    ("GET", "/test_typescript", 200),  # Sin servidor TypeScript muestra el error
+]
+
+
+def test_se_prueban_todas_las_vistas_publicas():
+    rutas = aplicacion.url_map.bind("localhost")
+    probadas = {rutas.match(url, method=metodo)[0] for metodo, url, _ in VISTAS_PUBLICAS}
+    assert probadas == modulo_app._ENDPOINTS_PUBLICOS
+
+
+@pytest.mark.parametrize("metodo,url,codigo", VISTAS_PUBLICAS)
+def test_vistas_publicas_no_exigen_sesion(cliente, metodo, url, codigo):
+    assert cliente.open(url, method=metodo).status_code == codigo
+    assert cliente.open(url, method=metodo, headers={"Accept": "application/json"}).status_code != 401
+
+
+# ========== Páginas memorizadas y ETag ==========
+
+def test_repeticion_con_if_none_match_responde_304(cliente):
+    _iniciar_sesion(cliente)
+    primera = cliente.get("/dashboard")
+    etag = primera.headers["ETag"]
+
+    segunda = cliente.get("/dashboard", headers={"If-None-Match": etag})
+
+    assert segunda.status_code == 304
+    assert segunda.data == b""
+
+
+def test_flash_pendiente_omite_cache_y_etag(cliente):
+    _iniciar_sesion(cliente)
+    llamadas = modulo_app._formulario_html.cache_info()
+
+    for url in ("/opcion3", "/opcion1"):  # Formulario memorizado y catálogo
+        with cliente.session_transaction() as sesion:
+            sesion["_flashes"] = [("info", "Mensaje pendiente")]
+
+        respuesta = cliente.get(url)
+
+        assert respuesta.status_code == 200
+        assert "ETag" not in respuesta.headers
+        assert "Mensaje pendiente" in respuesta.get_data(as_text=True)
+
+    assert modulo_app._formulario_html.cache_info() == llamadas
+    assert modulo_app._catalogos_html == {}
+
+
+def test_pagina_sin_mensajes_no_consume_el_flash_pendiente(cliente):
+    """El dashboard no muestra mensajes: quedan para la página siguiente"""
+    _iniciar_sesion(cliente)
+    with cliente.session_transaction() as sesion:
+        sesion["_flashes"] = [("info", "Mensaje pendiente")]
+
+    assert cliente.get("/dashboard").status_code == 200
+
+    assert "Mensaje pendiente" in cliente.get("/opcion1").get_data(as_text=True)
+
+
+def test_catalogo_se_vuelve_a_renderizar_si_cambia_la_hoja(cliente, ruta_excel):
+    _iniciar_sesion(cliente)
+    antes = cliente.get("/opcion1")
+    assert "Sede Matriz Manta" in antes.get_data(as_text=True)
+
+    wb = load_workbook(ruta_excel)
+    wb["sedes"].cell(2, 2).value = "Sede Matriz Renovada"
+    wb.save(ruta_excel)
+    modulo_app._servicios["db"]._revision_hojas = 0.0  # Revisar el disco ya
+
+    despues = cliente.get("/opcion1", headers={"If-None-Match": antes.headers["ETag"]})
+
+    assert despues.status_code == 200
+    assert "Sede Matriz Renovada" in despues.get_data(as_text=True)
+    assert despues.headers["ETag"] != antes.headers["ETag"]
+
+
+def test_gzip_solo_si_el_cliente_lo_acepta(cliente):
+    _iniciar_sesion(cliente)
+
+    plano = cliente.get("/opcion1")
+    comprimido = cliente.get("/opcion1", headers={"Accept-Encoding": "gzip"})
+
+    assert "Content-Encoding" not in plano.headers
+    assert comprimido.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in comprimido.headers["Vary"]
+    assert gzip.decompress(comprimido.data) == plano.data
@@ -0,0 +1,395 @@
+"""
+Pruebas del ExcelManager sobre libros temporales
+"""
+
+import os
+import threading
+import time
+
+import pytest
+from openpyxl import Workbook, load_workbook
+
+from database import excel_manager
+from database.excel_manager import ExcelManager, _CandadoLectorEscritor
+
+
+ENCABEZADOS_ASIGNACIONES = ["id_asignacion", "cedula_postulante", "carrera_id", "sede_id",
+                            "laboratorio", "edificio", "fecha_examen", "hora_inicio", "estado"]
+
+ENCABEZADOS = {
+    "registros_nacionales": ["cedula", "primer_nombre", "segundo_nombre", "apellido_paterno",
+                             "apellido_materno", "correo", "celular", "calificacion",
+                             "cuadro_honor", "estado", "fecha_registro"],
+    "inscripciones": ["id_inscripcion", "cedula_postulante", "carrera_id", "carrera_nombre",
+                      "jornada", "estado", "fecha_inscripcion"],
+    "evaluaciones": ["id_evaluacion", "cedula_postulante", "nota_verbal", "nota_numerica",
+                     "nota_abstracta", "puntaje_total", "estado", "fecha_evaluacion"],
+    "asignaciones": ENCABEZADOS_ASIGNACIONES,
+    "puntajes": ["id_puntaje", "cedula_postulante", "nota_bachillerato", "puntaje_senescyt",
+                 "bonificacion_merito", "puntaje_final", "porcentaje", "estado_aprobacion"],
+    "administradores": ["cedula", "nombre_completo", "rol", "email"],
+}
+
+
+def _crear_libro(ruta, filas_por_hoja):
+    """Guarda un libro con todas las hojas del sistema y las filas indicadas"""
+    wb = Workbook()
+    wb.remove(wb.active)
+    for hoja, encabezados in ENCABEZADOS.items():
+        ws = wb.create_sheet(hoja)
+        ws.append(encabezados)
+        for fila in filas_por_hoja.get(hoja, []):
+            ws.append(fila)
+    wb.save(ruta)
+
+
+def _filas(ws):
+    return [tuple(fila) for fila in ws.iter_rows(min_row=2, values_only=True)]
+
+
+@pytest.fixture
+def db(ruta_excel):
+    """ExcelManager sobre la copia; la escritura diferida solo ocurre al llamar volcar_cambios"""
+    manager = ExcelManager(ruta_excel)
+    manager.ESCRITURA_DIFERIDA = 3600
+    yield manager
+    if manager._temporizador is not None:
+        manager._temporizador.cancel()
+
+
+# ========== _eliminar_relacionados ==========
+
+def test_eliminar_relacionados_vacia_celdas_en_blanco_de_filas_movidas(tmp_path):
+    """Una fila que sube sobre una eliminada no hereda sus valores"""
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "asignaciones"
+    ws.append(ENCABEZADOS_ASIGNACIONES)
+    ws.append([4, "1316202082", 101, 1, "L1", "Edificio A", "2025-02-15", "08:00", "ASIGNADO"])
+    ws.append([5, "1350123456", 103, 2, "L3", None, None, None, None])
+
+    db = ExcelManager(str(tmp_path / "datos.xlsx"))
+    db._eliminar_relacionados(wb, "asignaciones", "1316202082")
+
+    assert _filas(ws) == [(5, "1350123456", 103, 2, "L3", None, None, None, None)]
+
+
+def test_eliminar_registro_compacta_hojas_hijas_con_columnas_opcionales_vacias(tmp_path):
+    """
+    La búsqueda previa por la columna de cédulas y la compactación juntas:
+    la cédula eliminada no está en la primera fila y la siguen filas con
+    columnas opcionales vacías
+    """
+    ruta = str(tmp_path / "datos.xlsx")
+    _crear_libro(ruta, {
+        "registros_nacionales": [
+            ["1350123456", "ANA", None, "MERA", None, "ana@uleam.edu.ec", None, 9, "NO", "PENDIENTE", None],
+            ["1316202082", "LUIS", "JOSE", "PONCE", "VERA", "luis@uleam.edu.ec", "0991234567",
+             9.5, "SI", "COMPLETO", "2025-01-10"],
+            ["1317924551", "EVA", None, "LOOR", None, "eva@uleam.edu.ec", None, 8, "NO", "PENDIENTE", None],
+        ],
+        "inscripciones": [
+            [1, "1350123456", 102, "Enfermería", None, None, None],
+            [2, "1316202082", 101, "Software", "MATUTINA", "CONFIRMADA", "2025-01-10"],
+            [3, "1317924551", 101, "Software", None, None, None],
+        ],
+        "asignaciones": [
+            [1, "1350123456", 102, 1, "L2", None, None, None, None],
+            [2, "1316202082", 101, 1, "L1", "Edificio A", "2025-02-15", "08:00", "ASIGNADO"],
+            [3, "1316202082", 101, 1, "L1", "Edificio A", "2025-02-16", "13:00", "ASIGNADO"],
+            [4, "1317924551", 101, 2, "L3", None, None, None, None],
+        ],
+    })
+
+    db = ExcelManager(ruta)
+    assert db.eliminar_registro("1316202082")[0]
+    assert db.volcar_cambios()
+
+    wb = load_workbook(ruta)
+    assert [fila[0] for fila in _filas(wb["registros_nacionales"])] == ["1350123456", "1317924551"]
+    assert _filas(wb["inscripciones"]) == [
+        (1, "1350123456", 102, "Enfermería", None, None, None),
+        (3, "1317924551", 101, "Software", None, None, None),
+    ]
+    assert _filas(wb["asignaciones"]) == [
+        (1, "1350123456", 102, 1, "L2", None, None, None, None),
+        (4, "1317924551", 101, 2, "L3", None, None, None, None),
+    ]
+
+
+# ========== Copia serializada (snapshot) ==========
+
+@pytest.fixture
+def lecturas_excel(monkeypatch):
+    """Cuenta las lecturas del Excel con _leer_excel"""
+    lecturas = []
+    leer_excel = ExcelManager._leer_excel
+
+    def contar(manager):
+        lecturas.append(manager.excel_path)
+        return leer_excel(manager)
+
+    monkeypatch.setattr(ExcelManager, "_leer_excel", contar)
+    return lecturas
+
+
+def test_snapshot_se_reutiliza_si_la_firma_coincide(ruta_excel, lecturas_excel):
+    primero = ExcelManager(ruta_excel)
+    assert primero.precargar()
+    assert os.path.exists(primero.snapshot_path)
+
+    segundo = ExcelManager(ruta_excel)
+    assert segundo.precargar()
+
+    assert len(lecturas_excel) == 1  # Solo el primero leyó el Excel
+    assert segundo._hojas == primero._hojas
+
+
+def test_snapshot_se_ignora_si_el_excel_cambio(ruta_excel, lecturas_excel):
+    assert ExcelManager(ruta_excel).precargar()
+
+    wb = load_workbook(ruta_excel)
+    wb["registros_nacionales"].cell(2, 10).value = "PENDIENTE"
+    wb.save(ruta_excel)
+
+    db = ExcelManager(ruta_excel)
+    assert db.obtener_registro_por_cedula("1316202082")["estado"] == "PENDIENTE"
+    assert len(lecturas_excel) == 2
+    # La copia se reescribe con la firma nueva
+    assert db._leer_snapshot(db._firma_archivo()) is not None
+
+
+def test_snapshot_corrupto_vuelve_a_leer_el_excel(ruta_excel, lecturas_excel):
+    db = ExcelManager(ruta_excel)
+    with open(db.snapshot_path, "wb") as archivo:
+        archivo.write(b"no es un pickle")
+
+    assert db.obtener_registro_por_cedula("1316202082")["estado"] == "COMPLETO"
+    assert len(lecturas_excel) == 1
+    assert db._leer_snapshot(db._firma_archivo()) is not None
+
+
+# ========== Escritura diferida ==========
+
+def test_modificacion_queda_pendiente_y_se_ve_en_memoria(db, ruta_excel):
+    """La modificación se ve de inmediato sin haber tocado el archivo"""
+    firma = os.stat(ruta_excel).st_mtime_ns
+
+    assert db.actualizar_registro("1316202082", {"estado": "pendiente"})[0]
+
+    assert db._pendiente
+    assert db._temporizador is not None
+    assert db.obtener_registro_por_cedula("1316202082")["estado"] == "PENDIENTE"
+    assert os.stat(ruta_excel).st_mtime_ns == firma
+    assert ExcelManager(ruta_excel).obtener_registro_por_cedula("1316202082")["estado"] == "COMPLETO"
+
+
+def test_volcar_cambios_escribe_de_forma_atomica(db, ruta_excel):
+    """Tras volcar, otro ExcelManager sobre el mismo archivo ve el cambio"""
+    assert db.actualizar_registro("1316202082", {"estado": "pendiente"})[0]
+
+    assert db.volcar_cambios()
+
+    assert not db._pendiente
+    assert not [nombre for nombre in os.listdir(os.path.dirname(ruta_excel))
+                if nombre.startswith("tmp")]  # Sin temporales sueltos
+    assert ExcelManager(ruta_excel).obtener_registro_por_cedula("1316202082")["estado"] == "PENDIENTE"
+
+
+def test_volcado_fallido_se_reintenta(db, ruta_excel, monkeypatch):
+    """Si guardar falla los cambios siguen pendientes y se vuelve a programar la escritura"""
+    assert db.actualizar_registro("1316202082", {"estado": "pendiente"})[0]
+
+    def reemplazo_fallido(origen, destino):
+        raise PermissionError("archivo abierto en otro programa")
+
+    monkeypatch.setattr(excel_manager.os, "replace", reemplazo_fallido)
+    assert not db.volcar_cambios()
+    assert db._pendiente
+    assert db._temporizador is not None
+    assert db._temporizador.interval == min(2 * db.ESCRITURA_DIFERIDA, db.REINTENTO_MAXIMO)
+
+    monkeypatch.undo()
+    db._temporizador.cancel()
+    assert db.volcar_cambios()
+    assert not db._pendiente
+    assert db._fallos_volcado == 0
+    assert ExcelManager(ruta_excel).obtener_registro_por_cedula("1316202082")["estado"] == "PENDIENTE"
+
+
+def test_modificacion_durante_el_guardado_sigue_pendiente(db, ruta_excel):
+    """
+    Un cambio hecho mientras se guarda (con acceso compartido) no se marca
+    como escrito: la segunda escritura lo lleva a disco
+    """
+    assert db.actualizar_registro("1316202082", {"estado": "pendiente"})[0]
+
+    principal = threading.current_thread()
+    pausa = threading.Event()
+    modificado = threading.Event()
+
+    class CandadoConPausa(_CandadoLectorEscritor):
+        """Retiene la sección exclusiva final de volcar_cambios hasta que termine la modificación"""
+        def __enter__(self):
+            if pausa.is_set() and threading.current_thread() is principal:
+                assert modificado.wait(5)
+            return super().__enter__()
+
+    db.lock = CandadoConPausa()
+    guardar = db._libro.save
+
+    def guardar_y_modificar(ruta):
+        guardar(ruta)
+        pausa.set()
+
+        def modificar():
+            db.actualizar_registro("1316202082", {"celular": "0999999999"})
+            modificado.set()
+
+        threading.Thread(target=modificar).start()
+
+    db._libro.save = guardar_y_modificar
+    assert not db.volcar_cambios()
+    assert db._pendiente
+
+    del db._libro.save
+    pausa.clear()
+    assert db.volcar_cambios()
+    registro = ExcelManager(ruta_excel).obtener_registro_por_cedula("1316202082")
+    assert (registro["estado"], registro["celular"]) == ("PENDIENTE", "0999999999")
+
+
+# ========== Índices incrementales ==========
+
+def _normalizar_indices(manager):
+    """
+    Índices por cédula de un manager, con '' como None: openpyxl no guarda
+    las celdas con texto vacío, así que al releer el Excel vuelven como None
+    (las conversiones a dict tratan ambos igual)
+    """
+    def fila(valores):
+        return tuple(None if valor == '' else valor for valor in valores)
+
+    return ({cedula: fila(valores) for cedula, valores in manager._indice_registros.items()},
+            {hoja: {cedula: fila(valores) for cedula, valores in indice.items()}
+             for hoja, indice in manager._indices_hijas.items()})
+
+
+def _indices_recien_cargados(ruta_excel):
+    """Índices de un ExcelManager que lee el Excel desde cero (sin la copia serializada)"""
+    fresco = ExcelManager(ruta_excel)
+    if os.path.exists(fresco.snapshot_path):
+        os.remove(fresco.snapshot_path)
+    assert fresco.precargar()
+    return _normalizar_indices(fresco)
+
+
+def test_indices_ajustados_coinciden_con_una_carga_nueva(db, ruta_excel):
+    """Cada modificación de una sola cédula ajusta los índices igual que reconstruirlos"""
+    assert db.precargar()
+    indice_registros = db._indice_registros
+    operaciones = [
+        lambda: db.insertar_registro({
+            "cedula": "1310000000", "primer_nombre": "ana", "apellido_paterno": "mera",
+            "correo": "ana.mera@uleam.edu.ec", "celular": "0991112233", "calificacion": 9}),
+        lambda: db.insertar_inscripcion({
+            "cedula_postulante": "1310000000", "carrera_id": 101,
+            "carrera_nombre": "Tecnologías de la Información", "jornada": "MATUTINA"}),
+        lambda: db.actualizar_registro("1310000000", {"estado": "completo", "calificacion": 9.5}),
+        lambda: db.eliminar_registro("1316202082"),
+    ]
+
+    for operacion in operaciones:
+        assert operacion()[0]
+        assert db.volcar_cambios()
+        assert _normalizar_indices(db) == _indices_recien_cargados(ruta_excel)
+
+    # Se ajustaron en su lugar, sin reconstruirlos
+    assert db._indice_registros is indice_registros
+
+
+# ========== _CandadoLectorEscritor ==========
+
+def _en_hilo(funcion):
+    """Ejecuta funcion en un hilo daemon ya iniciado"""
+    hilo = threading.Thread(target=funcion, daemon=True)
+    hilo.start()
+    return hilo
+
+
+def _esperar(condicion, segundos=5):
+    """Espera activamente a que condicion() sea verdadera"""
+    limite = time.monotonic() + segundos
+    while not condicion():
+        assert time.monotonic() < limite
+        time.sleep(0.005)
+
+
+def _lector(candado, dentro, liberar, orden=None):
+    """Función de hilo: toma la lectura, avisa y la retiene hasta liberar"""
+    def leer():
+        with candado.lectura():
+            if orden is not None:
+                orden.append("lector")
+            dentro.set()
+            liberar.wait(5)
+    return leer
+
+
+def test_candado_admite_dos_lectores_a_la_vez():
+    candado = _CandadoLectorEscritor()
+    dentro_1, dentro_2, liberar = threading.Event(), threading.Event(), threading.Event()
+
+    hilos = [_en_hilo(_lector(candado, dentro_1, liberar)),
+             _en_hilo(_lector(candado, dentro_2, liberar))]
+
+    assert dentro_1.wait(5) and dentro_2.wait(5)
+    assert candado._lectores == 2
+    liberar.set()
+    for hilo in hilos:
+        hilo.join(5)
+
+
+def test_candado_escritor_espera_a_los_lectores_activos():
+    candado = _CandadoLectorEscritor()
+    dentro, liberar, escribiendo = threading.Event(), threading.Event(), threading.Event()
+    lector = _en_hilo(_lector(candado, dentro, liberar))
+    assert dentro.wait(5)
+
+    def escribir():
+        with candado:
+            escribiendo.set()
+
+    escritor = _en_hilo(escribir)
+    _esperar(lambda: candado._escritores_en_espera == 1)
+    assert not escribiendo.wait(0.1)
+
+    liberar.set()
+    assert escribiendo.wait(5)
+    lector.join(5)
+    escritor.join(5)
+
+
+def test_candado_lector_nuevo_espera_al_escritor_en_espera():
+    candado = _CandadoLectorEscritor()
+    orden = []
+    dentro, liberar = threading.Event(), threading.Event()
+    primero = _en_hilo(_lector(candado, dentro, liberar))
+    assert dentro.wait(5)
+
+    def escribir():
+        with candado:
+            orden.append("escritor")
+
+    escritor = _en_hilo(escribir)
+    _esperar(lambda: candado._escritores_en_espera == 1)
+
+    dentro_nuevo = threading.Event()
+    nuevo = _en_hilo(_lector(candado, dentro_nuevo, liberar, orden))
+    assert not dentro_nuevo.wait(0.1)
+
+    liberar.set()
+    assert dentro_nuevo.wait(5)
+    assert orden == ["escritor", "lector"]
+    for hilo in (primero, escritor, nuevo):
+        hilo.join(5)